@@ -7,7 +7,6 @@ import os
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import plotly.graph_objects as go
 from typing import Dict, List
 
 # Set page config to use wide mode and add a favicon
@@ -51,8 +50,8 @@ class DisneyPlusDashboard:
         Returns:
             pd.DataFrame: Processed Disney+ content data
         """
-        data_path = os.path.join('..', 'data', 'processed', 'disney_plus_content_processed.csv')
-        return pd.read_csv(data_path)
+        data_path = os.path.join('..', 'data', 'processed', 'disney_plus_content_processed.parquet')
+        return pd.read_parquet(data_path)
     
     def create_header(self):
         """Create the dashboard header."""
@@ -129,8 +128,8 @@ class DisneyPlusDashboard:
         top_content = genre_content.nlargest(5, 'vote_average')
         
         st.write("Top Rated Content in Selected Genre:")
-        for _, content in top_content.iterrows():
-            st.write(f"- {content['title']} (Rating: {content['vote_average']})")
+        for content in top_content.itertuples(index=False):
+            st.write(f"- {content.title} (Rating: {content.vote_average:.1f})")
     
     def run_dashboard(self):
         """Run the complete dashboard."""
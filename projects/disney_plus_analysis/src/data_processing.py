@@ -53,6 +53,15 @@ class DisneyPlusDataProcessor:
         # Extract year from release_date
         df['release_year'] = df['release_date'].dt.year
         
+        # Ratings are shown to one decimal, so float32 is plenty and halves what the dashboard scans
+        score_columns = [col for col in ['vote_average', 'popularity'] if col in df.columns]
+        df[score_columns] = df[score_columns].astype('float32')
+        
+        # Few distinct languages and genre lists - categorical is far smaller and the dashboard groups on codes
+        for col in ['original_language', 'genre_ids']:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        
         return df
     
     def encode_categorical_features(self, df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
@@ -93,7 +102,7 @@ class DisneyPlusDataProcessor:
     
     def save_processed_data(self, df: pd.DataFrame, filename: str) -> None:
         """
-        Save processed data to CSV file.
+        Save processed data to a Parquet file.
         Args:
             df: DataFrame to save
             filename: Output filename
@@ -102,7 +111,7 @@ class DisneyPlusDataProcessor:
         os.makedirs(output_dir, exist_ok=True)
         
         output_path = os.path.join(output_dir, filename)
-        df.to_csv(output_path, index=False)
+        df.to_parquet(output_path, index=False)
         logger.info(f"Processed data saved to {output_path}")
 
 def main():
@@ -124,7 +133,7 @@ def main():
     logger.info(f"Content metrics: {metrics}")
     
     # Save processed data
-    processor.save_processed_data(processed_data, 'disney_plus_content_processed.csv')
+    processor.save_processed_data(processed_data, 'disney_plus_content_processed.parquet')
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -9,30 +9,76 @@ Usage:
     python run_analytics_pipeline.py  # runs everything
     python run_analytics_pipeline.py --dashboard-only  # just launch dashboard
     
-TODO: Add parallel processing for the ML steps
 TODO: Better error recovery if one component fails
 """
 
+import os
 import sys
 import subprocess
 import argparse
+import importlib.util
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+RAW_DATA_FILES = [
+    'data/raw/guest_profiles.csv', 'data/raw/resort_bookings.csv',
+    'data/raw/dining_reservations.csv', 'data/raw/amenity_usage.csv'
+]
+
+# Step script -> (inputs, outputs). A step is up to date when all its outputs are newer than the script and inputs
+STEP_FILES = {
+    'src/resort_data_generator.py': ([], RAW_DATA_FILES + ['data/processed/monthly_bookings.parquet']),
+    'src/guest_analytics.py': (RAW_DATA_FILES, ['data/processed/guest_analytics_dataset.parquet',
+                                                'data/processed/analytics_summary.json']),
+    'src/revenue_optimization.py': (RAW_DATA_FILES, ['data/processed/revenue_optimization_summary.json',
+                                                     'models/occupancy_forecasting_model.pkl',
+                                                     'models/dynamic_pricing_model.pkl']),
+}
+
+def file_mtimes(paths):
+    """Modification times for the given files, listing each directory once instead of a stat per file"""
+    mtimes = {}
+    for directory in {str(Path(f).parent) for f in paths}:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        mtimes[f"{directory}/{entry.name}"] = entry.stat().st_mtime
+        except FileNotFoundError:
+            continue
+    return mtimes
+
+def step_is_up_to_date(script):
+    """Check whether a step's outputs are newer than everything it reads - lets reruns skip the slow steps"""
+    inputs, outputs = STEP_FILES[script]
+    mtimes = file_mtimes([script] + inputs + outputs)
+    try:
+        newest_input = max(mtimes[f] for f in [script] + inputs)
+        oldest_output = min(mtimes[f] for f in outputs)
+    except KeyError:
+        return False
+    return oldest_output >= newest_input
+
+def print_banner(title):
+    """Print a section banner in one write - keeps banners from steps 2 & 3 from interleaving"""
+    rule = '=' * 60
+    print(f"\n{rule}\n{title}\n{rule}", flush=True)
+
 def run_command(command, description, cwd=None):
     """Execute a command and handle results"""
-    print(f"\n{'='*60}")
-    print(f"🚀 {description}")
-    print(f"{'='*60}")
+    print_banner(f"🚀 {description}")
     
+    start_time = time.perf_counter()
     try:
         if cwd:
             result = subprocess.run(command, cwd=cwd, capture_output=True, text=True, shell=True)
         else:
             result = subprocess.run(command, capture_output=True, text=True, shell=True)
         
+        elapsed = time.perf_counter() - start_time
         if result.returncode == 0:
-            print(f"✅ {description} - COMPLETED SUCCESSFULLY")
+            print(f"✅ {description} - COMPLETED SUCCESSFULLY ({elapsed:.1f}s)")
             if result.stdout:
                 print("Output:")
                 print(result.stdout[-500:])  # Show last 500 characters
@@ -47,22 +93,40 @@ def run_command(command, description, cwd=None):
     
     return True
 
+def launch_dashboard():
+    """Start the Streamlit dashboard and stream its output straight to the terminal
+    
+    run_command captures output and only returns once the process exits, which a
+    Streamlit server never does - so the URL and any errors were never shown.
+    """
+    print_banner("🚀 Launching Disney Resort Operations Dashboard")
+    
+    proc = subprocess.Popen([sys.executable, '-m', 'streamlit', 'run', 'src/resort_dashboard.py'])
+    try:
+        proc.wait()
+    except KeyboardInterrupt:
+        print("\n👋 Stopping dashboard...")
+        proc.terminate()
+        proc.wait()
+    
+    return proc.returncode
+
 def check_dependencies():
     """Check if we have all the required packages - saves headaches later"""
     print("\n🔍 Checking dependencies...")
     
-    required_packages = [
-        'pandas', 'numpy', 'scikit-learn', 
-        'plotly', 'streamlit', 'faker'
-    ]
+    # pip name -> import name; find_spec only locates the package, it doesn't import it
+    required_packages = {
+        'pandas': 'pandas', 'numpy': 'numpy', 'scikit-learn': 'sklearn', 
+        'plotly': 'plotly', 'streamlit': 'streamlit', 'faker': 'faker'
+    }
     
     missing_packages = []
     
-    for package in required_packages:
-        try:
-            __import__(package)
+    for package, module_name in required_packages.items():
+        if importlib.util.find_spec(module_name) is not None:
             print(f"✅ {package} - installed")
-        except ImportError:
+        else:
             missing_packages.append(package)
             print(f"❌ {package} - missing")
     
@@ -92,6 +156,7 @@ def main():
     parser.add_argument('--skip-revenue', action='store_true', help='Skip revenue optimization step')
     parser.add_argument('--dashboard-only', action='store_true', help='Launch dashboard only')
     parser.add_argument('--install-deps', action='store_true', help='Install dependencies from requirements.txt')
+    parser.add_argument('--force', action='store_true', help='Rerun steps even if their outputs are up to date')
     
     args = parser.parse_args()
     
@@ -114,78 +179,71 @@ def main():
     # Dashboard only mode
     if args.dashboard_only:
         print("\n🎯 Dashboard-only mode activated")
-        print("📊 Launching Disney Resort Operations Dashboard...")
-        run_command("streamlit run src/resort_dashboard.py", 
-                   "Launching Resort Operations Dashboard")
+        launch_dashboard()
         return
     
     # Pipeline execution
+    pipeline_start = time.perf_counter()
     success_count = 0
     total_steps = 4
     
     # Step 1: Generate Resort Data
-    if not args.skip_data:
-        print("\n" + "="*60)
-        print("📊 STEP 1: GENERATING RESORT OPERATIONAL DATA")
-        print("="*60)
+    if args.skip_data:
+        print("\n⏭️  STEP 1: Skipped - Data generation")
+        success_count += 1
+    elif not args.force and step_is_up_to_date('src/resort_data_generator.py'):
+        print("\n♻️  STEP 1: Up to date - Data generation")
+        success_count += 1
+    else:
+        print_banner("📊 STEP 1: GENERATING RESORT OPERATIONAL DATA")
         
         if run_command("python src/resort_data_generator.py", 
                       "Generating synthetic resort operational data"):
             success_count += 1
             print("✅ Resort data generation completed successfully")
-            time.sleep(2)  # Brief pause
         else:
             print("❌ Data generation failed. Continuing with existing data...")
-    else:
-        print("\n⏭️  STEP 1: Skipped - Data generation")
-        success_count += 1
     
-    # Step 2: Guest Analytics
-    if not args.skip_analytics:
-        print("\n" + "="*60)
-        print("🧠 STEP 2: GUEST ANALYTICS & SEGMENTATION")
-        print("="*60)
-        
-        if run_command("python src/guest_analytics.py", 
-                      "Running guest analytics and machine learning models"):
-            success_count += 1
-            print("✅ Guest analytics completed successfully")
-            time.sleep(2)
-        else:
-            print("❌ Guest analytics failed. Continuing...")
-    else:
-        print("\n⏭️  STEP 2: Skipped - Guest analytics")
-        success_count += 1
+    # Steps 2 & 3 only read the raw data from step 1, not each other's output - run them side by side
+    ml_steps = [
+        (2, "🧠 STEP 2: GUEST ANALYTICS & SEGMENTATION", args.skip_analytics, "Guest analytics",
+         "src/guest_analytics.py", "Running guest analytics and machine learning models"),
+        (3, "💰 STEP 3: REVENUE OPTIMIZATION ANALYSIS", args.skip_revenue, "Revenue optimization",
+         "src/revenue_optimization.py", "Running revenue optimization models and analysis"),
+    ]
     
-    # Step 3: Revenue Optimization
-    if not args.skip_revenue:
-        print("\n" + "="*60)
-        print("💰 STEP 3: REVENUE OPTIMIZATION ANALYSIS")
-        print("="*60)
+    with ThreadPoolExecutor(max_workers=len(ml_steps)) as executor:
+        futures = {}
+        for step_number, banner, skipped, step_name, script, description in ml_steps:
+            if skipped:
+                print(f"\n⏭️  STEP {step_number}: Skipped - {step_name}")
+                success_count += 1
+                continue
+            if not args.force and step_is_up_to_date(script):
+                print(f"\n♻️  STEP {step_number}: Up to date - {step_name}")
+                success_count += 1
+                continue
+            
+            print_banner(banner)
+            futures[executor.submit(run_command, f"python {script}", description)] = step_name
         
-        if run_command("python src/revenue_optimization.py", 
-                      "Running revenue optimization models and analysis"):
-            success_count += 1
-            print("✅ Revenue optimization completed successfully")
-            time.sleep(2)
-        else:
-            print("❌ Revenue optimization failed. Continuing...")
-    else:
-        print("\n⏭️  STEP 3: Skipped - Revenue optimization")
-        success_count += 1
+        for future in as_completed(futures):
+            step_name = futures[future]
+            if future.result():
+                success_count += 1
+                print(f"✅ {step_name} completed successfully")
+            else:
+                print(f"❌ {step_name} failed. Continuing...")
     
     # Step 4: Launch Dashboard
-    print("\n" + "="*60)
-    print("🖥️  STEP 4: LAUNCHING INTERACTIVE DASHBOARD")
-    print("="*60)
+    print_banner("🖥️  STEP 4: LAUNCHING INTERACTIVE DASHBOARD")
     
     print("🎯 All pipeline steps completed!")
     print(f"📈 Success Rate: {success_count}/{total_steps} steps completed")
+    print(f"⏱️  Pipeline time: {time.perf_counter() - pipeline_start:.1f}s")
     
     # Final results summary
-    print("\n" + "="*60)
-    print("📊 PIPELINE EXECUTION SUMMARY")
-    print("="*60)
+    print_banner("📊 PIPELINE EXECUTION SUMMARY")
     
     steps = [
         ("Resort Data Generation", not args.skip_data),
@@ -204,9 +262,7 @@ def main():
     print("\n💡 Use Ctrl+C to stop the dashboard when finished")
     
     # Launch the dashboard
-    time.sleep(3)
-    run_command("streamlit run src/resort_dashboard.py", 
-               "Launching Disney Resort Operations Dashboard")
+    launch_dashboard()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -14,7 +14,7 @@ from pathlib import Path
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
-import json
+import orjson
 import warnings
 
 # ML Libraries
@@ -31,6 +31,17 @@ warnings.filterwarnings('ignore')
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Dining suggestions per guest segment - built once at import instead of on every recommendation
+SEGMENT_DINING_SUGGESTIONS = {
+    'Young Couples': ['Fine dining restaurants', 'Romantic atmosphere venues', 'Wine bars'],
+    'Families with Toddlers': ['Character dining', 'Buffet restaurants', 'Kid-friendly menus'],
+    'Families with Teens': ['Quick service', 'International cuisine', 'Late night dining'],
+    'Multi-Generation': ['Large table restaurants', 'Varied menu options', 'Accessible venues'],
+    'Empty Nesters': ['Signature restaurants', 'Cultural cuisine', 'Wine experiences'],
+    'Business Travelers': ['Quick service', 'Room service', 'Grab-and-go options'],
+    'International Families': ['Cultural dining', 'Dietary accommodations', 'Authentic experiences']
+}
+
 class GuestAnalyticsEngine:
     """Main analytics class - does clustering, ML models, recommendations
     
@@ -92,6 +103,9 @@ class GuestAnalyticsEngine:
         analytics_df = analytics_df.merge(amenity_metrics, on='guest_id', how='left')
         
         # Fill missing values - probably should be more sophisticated
+        # Text columns get 'None' first - a column mixing 0 with strings can't be written to Parquet
+        text_columns = ['loyalty_tier', 'celebration']
+        analytics_df[text_columns] = analytics_df[text_columns].fillna('None')
         analytics_df = analytics_df.fillna(0)  # simple fill for now
         
         # Engineer additional features
@@ -167,26 +181,32 @@ class GuestAnalyticsEngine:
         df['checkin_day_of_week'] = df['checkin_date'].dt.dayofweek
         df['is_weekend_checkin'] = (df['checkin_day_of_week'] >= 5).astype(int)
         
-        # Financial behavior features
-        df['spend_per_night'] = df['total_cost'] / df['stay_length']
-        df['spend_per_person'] = df['total_cost'] / df['party_size']
-        df['total_spend'] = df['total_cost'] + df.get('total_dining_spend', 0) + df.get('total_amenity_spend', 0)
-        df['dining_ratio'] = df.get('total_dining_spend', 0) / (df['total_spend'] + 1)  # Avoid division by zero
-        df['amenity_ratio'] = df.get('total_amenity_spend', 0) / (df['total_spend'] + 1)
+        # Financial behavior features - columns pulled out as arrays once, arithmetic done in numpy
+        total_cost = df['total_cost'].to_numpy(dtype=float)
+        dining_spend = df['total_dining_spend'].to_numpy(dtype=float) if 'total_dining_spend' in df else 0.0
+        amenity_spend = df['total_amenity_spend'].to_numpy(dtype=float) if 'total_amenity_spend' in df else 0.0
+        total_spend = total_cost + dining_spend + amenity_spend
+        
+        df['spend_per_night'] = total_cost / df['stay_length'].to_numpy()
+        df['spend_per_person'] = total_cost / df['party_size'].to_numpy()
+        df['total_spend'] = total_spend
+        df['dining_ratio'] = dining_spend / (total_spend + 1)  # Avoid division by zero
+        df['amenity_ratio'] = amenity_spend / (total_spend + 1)
         
         # Loyalty and experience features
         df['loyalty_score'] = df['loyalty_tier'].map({
             'None': 0, 'Silver': 1, 'Gold': 2, 'Platinum': 3
         }).fillna(0)
         
-        df['experience_level'] = np.where(df['previous_visits'] == 0, 'First_Time',
-                                np.where(df['previous_visits'] <= 2, 'Occasional', 
-                                np.where(df['previous_visits'] <= 5, 'Regular', 'Frequent')))
+        # np.select picks the first matching condition in one pass - no nested np.where temporaries
+        visits = df['previous_visits']
+        df['experience_level'] = np.select([visits == 0, visits <= 2, visits <= 5],
+                                           ['First_Time', 'Occasional', 'Regular'], default='Frequent')
         
         # Booking behavior features
-        df['booking_lead_time_category'] = np.where(df['days_advance_booked'] <= 14, 'Last_Minute',
-                                          np.where(df['days_advance_booked'] <= 60, 'Moderate',
-                                          np.where(df['days_advance_booked'] <= 180, 'Early', 'Very_Early')))
+        lead_days = df['days_advance_booked']
+        df['booking_lead_time_category'] = np.select([lead_days <= 14, lead_days <= 60, lead_days <= 180],
+                                                     ['Last_Minute', 'Moderate', 'Early'], default='Very_Early')
         
         # Resort preference features
         df['resort_category'] = df['resort_name'].map({
@@ -201,9 +221,9 @@ class GuestAnalyticsEngine:
         
         # Calculate guest value score (combination of spend, loyalty, and frequency)
         df['guest_value_score'] = (
-            (df['total_spend'] / df['total_spend'].max()) * 0.4 +
-            (df['loyalty_score'] / 3) * 0.3 +
-            (np.minimum(df['previous_visits'], 10) / 10) * 0.3
+            (total_spend / total_spend.max()) * 0.4 +
+            (df['loyalty_score'].to_numpy() / 3) * 0.3 +
+            (np.minimum(df['previous_visits'].to_numpy(), 10) / 10) * 0.3
         )
         
         return df
@@ -267,9 +287,11 @@ class GuestAnalyticsEngine:
         
         cluster_profiles = {}
         
-        for cluster_id in sorted(df['guest_cluster'].unique()):
-            cluster_data = df[df['guest_cluster'] == cluster_id]
-            
+        # One grouping pass instead of a boolean mask per cluster
+        clusters = df.groupby('guest_cluster')
+        feature_means = clusters[features].mean().round(2)
+        
+        for cluster_id, cluster_data in clusters:
             # Calculate cluster characteristics
             profile = {
                 'cluster_id': int(cluster_id),
@@ -278,13 +300,9 @@ class GuestAnalyticsEngine:
                 'characteristics': {},
                 'top_segments': cluster_data['segment'].value_counts().head(3).to_dict(),
                 'preferred_resorts': cluster_data['resort_name'].value_counts().head(3).to_dict(),
-                'average_metrics': {}
+                'average_metrics': feature_means.loc[cluster_id].to_dict()
             }
             
-            # Calculate average metrics for each feature
-            for feature in features:
-                profile['average_metrics'][feature] = round(cluster_data[feature].mean(), 2)
-            
             # Determine cluster personality
             profile['cluster_name'] = self._assign_cluster_name(profile['average_metrics'])
             
@@ -361,6 +379,7 @@ class GuestAnalyticsEngine:
         model_metrics = {
             'accuracy': round(accuracy, 3),
             'feature_importance': feature_importance.head(10).to_dict('records'),
+            'feature_importance_top8': feature_importance.head(8).to_dict('records'),  # what the dashboard plots
             'model_type': 'Random Forest Classifier',
             'training_samples': len(X_train)
         }
@@ -451,6 +470,7 @@ class GuestAnalyticsEngine:
             'mae': round(mae, 2),
             'r2_score': round(r2, 3),
             'feature_importance': feature_importance.head(10).to_dict('records'),
+            'feature_importance_top6': feature_importance.head(6).to_dict('records'),  # what the dashboard plots
             'model_type': 'Gradient Boosting Regressor',
             'training_samples': len(X_train)
         }
@@ -461,7 +481,8 @@ class GuestAnalyticsEngine:
     def generate_guest_recommendations(self, df: pd.DataFrame, guest_id: int) -> Dict:
         """Generate personalized recommendations for a specific guest"""
         
-        guest_data = df[df['guest_id'] == guest_id].iloc[0]
+        # Position lookup on the raw ids - no filtered copy of the frame just to read one row
+        guest_data = df.iloc[np.flatnonzero(df['guest_id'].to_numpy() == guest_id)[0]]
         cluster_id = guest_data['guest_cluster']
         
         # Find similar guests in same cluster
@@ -499,18 +520,8 @@ class GuestAnalyticsEngine:
     def _get_dining_recommendations(self, similar_guests: pd.DataFrame, guest_data: pd.Series) -> List[str]:
         """Get dining recommendations based on guest preferences and similar guests"""
         
-        # Based on guest segment preferences
-        segment_dining = {
-            'Young Couples': ['Fine dining restaurants', 'Romantic atmosphere venues', 'Wine bars'],
-            'Families with Toddlers': ['Character dining', 'Buffet restaurants', 'Kid-friendly menus'],
-            'Families with Teens': ['Quick service', 'International cuisine', 'Late night dining'],
-            'Multi-Generation': ['Large table restaurants', 'Varied menu options', 'Accessible venues'],
-            'Empty Nesters': ['Signature restaurants', 'Cultural cuisine', 'Wine experiences'],
-            'Business Travelers': ['Quick service', 'Room service', 'Grab-and-go options'],
-            'International Families': ['Cultural dining', 'Dietary accommodations', 'Authentic experiences']
-        }
-        
-        return segment_dining.get(guest_data.get('segment', ''), ['Popular resort restaurants'])
+        # Based on guest segment preferences - copy so callers can't edit the shared table
+        return list(SEGMENT_DINING_SUGGESTIONS.get(guest_data.get('segment', ''), ['Popular resort restaurants']))
     
     def _get_amenity_recommendations(self, similar_guests: pd.DataFrame, guest_data: pd.Series) -> List[str]:
         """Get amenity recommendations based on guest profile"""
@@ -559,7 +570,7 @@ class GuestAnalyticsEngine:
         """Save all analytics results"""
         try:
             # Save processed dataset
-            df.to_csv(self.processed_path / 'guest_analytics_dataset.csv', index=False)
+            df.to_parquet(self.processed_path / 'guest_analytics_dataset.parquet', index=False)
             
             # Save analysis results
             analytics_summary = {
@@ -571,8 +582,8 @@ class GuestAnalyticsEngine:
                 'key_insights': self._generate_key_insights(df, cluster_analysis)
             }
             
-            with open(self.processed_path / 'analytics_summary.json', 'w') as f:
-                json.dump(analytics_summary, f, indent=2, default=str)
+            with open(self.processed_path / 'analytics_summary.json', 'wb') as f:
+                f.write(orjson.dumps(analytics_summary, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY, default=str))
             
             logger.info("✅ Analytics results saved successfully")
             
@@ -592,10 +603,9 @@ class GuestAnalyticsEngine:
         insights.append(f"Average guest spending: ${avg_spend:,.0f} per stay")
         
         # Segmentation insights
-        largest_segment = max(cluster_analysis.keys(), 
-                            key=lambda x: cluster_analysis[x]['size'])
-        insights.append(f"Largest guest segment: {cluster_analysis[largest_segment]['cluster_name']} "
-                       f"({cluster_analysis[largest_segment]['percentage']}% of guests)")
+        largest_segment = max(cluster_analysis.values(), key=lambda profile: profile['size'])
+        insights.append(f"Largest guest segment: {largest_segment['cluster_name']} "
+                       f"({largest_segment['percentage']}% of guests)")
         
         # Loyalty insights
         loyalty_distribution = df['loyalty_tier'].value_counts(normalize=True)
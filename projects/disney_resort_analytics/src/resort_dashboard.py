@@ -12,13 +12,10 @@ NOTE: Some of the metrics calculations might be off - need to double-check
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import json
+import orjson
 from pathlib import Path
 from datetime import datetime, timedelta
-import time
+# plotly gets imported inside the render_* methods - it's most of the cold-start import time
 
 # Page configuration
 st.set_page_config(
@@ -77,6 +74,41 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+@st.cache_data
+def dining_aggregates(dining):
+    """Restaurant and meal-time rollups - one groupby each, shared across reruns"""
+    by_restaurant = dining.groupby('restaurant_name', observed=True)['estimated_cost'].sum().round(2)
+    by_meal_time = dining.groupby('meal_time', observed=True)['estimated_cost'].agg(['sum', 'count']).reset_index()
+    by_meal_time.columns = ['Meal Time', 'Revenue', 'Reservations']
+    return by_restaurant, by_meal_time
+
+@st.cache_data
+def amenity_aggregates(amenities):
+    """Per-amenity usage and revenue rollup"""
+    amenity_performance = amenities.groupby('amenity_type', observed=True).agg({
+        'cost': ['sum', 'mean', 'count'],
+        'duration_minutes': 'mean'
+    }).round(2)
+    
+    amenity_performance.columns = ['Total Revenue', 'Avg Cost', 'Usage Count', 'Avg Duration']
+    return amenity_performance.reset_index()
+
+@st.cache_data
+def checkin_date_bounds(_bookings, n_bookings):
+    """Min/max check-in dates for the sidebar - keyed on row count so the frame itself isn't hashed"""
+    bounds = _bookings['checkin_date'].agg(['min', 'max'])
+    return bounds['min'].date(), bounds['max'].date()
+
+@st.cache_data(hash_funcs={pd.DataFrame: lambda df: (len(df), df['stay_length'].sum())})
+def _occupancy_rate(bookings, total_rooms):
+    """Room-nights over capacity - keyed on row count + room-nights so the whole frame isn't hashed"""
+    # TODO: this calculation doesn't account for different room types properly
+    total_room_nights = bookings['stay_length'].sum()
+    total_capacity = total_rooms * bookings['checkin_date'].nunique() if len(bookings) > 0 else total_rooms
+    
+    occ_rate = total_room_nights / total_capacity if total_capacity > 0 else 0
+    return min(occ_rate, 1.0)  # cap at 100%
+
 class ResortOperationsDashboard:
     """Main dashboard class - handles all the Streamlit UI stuff
     
@@ -101,39 +133,63 @@ class ResortOperationsDashboard:
             'Pop Century': {'category': 'Value', 'rooms': 2880, 'icon': '📻'},
             'All Star Sports': {'category': 'Value', 'rooms': 1920, 'icon': '⚽'}
         }
+        # Same info as a small frame so it can be joined/reduced instead of looped over
+        self._resort_df = pd.DataFrame.from_dict(self.resort_info, orient='index')[['category', 'rooms', 'icon']]
     
     @st.cache_data
     def load_resort_data(_self):
         """Load data with caching - the _self thing is weird but required for Streamlit"""
         try:
             # Load raw operational data
-            bookings = pd.read_csv(_self.raw_path / 'resort_bookings.csv')
+            # Dates parsed here, once per cached load, rather than on every rerun
+            bookings = pd.read_csv(_self.raw_path / 'resort_bookings.csv',
+                                   parse_dates=['booking_date', 'checkin_date', 'checkout_date'])
             guests = pd.read_csv(_self.raw_path / 'guest_profiles.csv')
             dining = pd.read_csv(_self.raw_path / 'dining_reservations.csv')
             amenities = pd.read_csv(_self.raw_path / 'amenity_usage.csv')
             
+            # Low-cardinality keys as categoricals so the groupbys below take the integer-coded path
+            bookings['resort_name'] = bookings['resort_name'].astype('category')
+            dining['restaurant_name'] = dining['restaurant_name'].astype('category')
+            dining['meal_time'] = dining['meal_time'].astype('category')
+            amenities['amenity_type'] = amenities['amenity_type'].astype('category')
+            
+            # KPI totals sum these with plain numpy reductions, so they have to be NaN-free
+            assert not bookings['total_cost'].isna().any(), "resort_bookings.csv has missing total_cost values"
+            assert not dining['estimated_cost'].isna().any(), "dining_reservations.csv has missing estimated_cost values"
+            assert not amenities['cost'].isna().any(), "amenity_usage.csv has missing cost values"
+            
+            # Monthly trend rollup is written by the data generator; older data dirs won't have it
+            try:
+                monthly_df = pd.read_parquet(_self.processed_path / 'monthly_bookings.parquet')
+            except FileNotFoundError:
+                monthly_df = bookings.set_index('checkin_date').resample('MS').agg(
+                    revenue=('total_cost', 'sum'),
+                    bookings=('booking_id', 'count')
+                )
+                monthly_df.index.name = 'checkin_month'
+                monthly_df = monthly_df.reset_index()
+            
             # Load processed analytics if available
             try:
-                analytics_df = pd.read_csv(_self.processed_path / 'guest_analytics_dataset.csv')
-                with open(_self.processed_path / 'analytics_summary.json', 'r') as f:
-                    analytics_summary = json.load(f)
+                analytics_df = pd.read_parquet(_self.processed_path / 'guest_analytics_dataset.parquet')
+                analytics_summary = orjson.loads((_self.processed_path / 'analytics_summary.json').read_bytes())
             except FileNotFoundError:
                 analytics_df = pd.DataFrame()
                 analytics_summary = {}
             
             # Load revenue optimization results if available
             try:
-                with open(_self.processed_path / 'revenue_optimization_summary.json', 'r') as f:
-                    revenue_summary = json.load(f)
+                revenue_summary = orjson.loads((_self.processed_path / 'revenue_optimization_summary.json').read_bytes())
             except FileNotFoundError:
                 revenue_summary = {}
             
-            return bookings, guests, dining, amenities, analytics_df, analytics_summary, revenue_summary
+            return bookings, guests, dining, amenities, monthly_df, analytics_df, analytics_summary, revenue_summary
             
         except FileNotFoundError as e:
             st.error(f"❌ Data files not found. Please run data generation first.")
             # Return empty dataframes so the app doesn't crash
-            return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), {}, {}
+            return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), {}, {}
     
     def render_dashboard_header(self):
         """Render main dashboard header"""
@@ -150,7 +206,9 @@ class ResortOperationsDashboard:
             st.info("🕐 **Live Dashboard** - Auto-refreshing")
         with col4:
             if st.button("🔄 Refresh Data"):
-                st.cache_data.clear()
+                self.load_resort_data.clear()
+                checkin_date_bounds.clear()  # these two are keyed on cheap summaries, not content
+                _occupancy_rate.clear()
                 st.rerun()
         
         st.markdown("---")
@@ -162,15 +220,16 @@ class ResortOperationsDashboard:
         # Calculate metrics - doing this every time the page loads, should probably cache
         total_bookings = len(bookings)
         total_guests = len(guests)
-        total_room_revenue = bookings['total_cost'].sum()
-        total_dining_revenue = dining['estimated_cost'].sum()
-        total_amenity_revenue = amenities['cost'].sum()
+        total_room_revenue = bookings['total_cost'].to_numpy().sum()
+        total_dining_revenue = dining['estimated_cost'].to_numpy().sum()
+        total_amenity_revenue = amenities['cost'].to_numpy().sum()
         total_revenue = total_room_revenue + total_dining_revenue + total_amenity_revenue
         
         # print(f"DEBUG: Revenue breakdown - Room: ${total_room_revenue/1e6:.1f}M, Dining: ${total_dining_revenue/1e6:.1f}M")
         
-        avg_stay_len = bookings['stay_length'].mean()  # shorter var name
-        avg_party_sz = bookings['party_size'].mean()
+        # Plain numpy reductions like the revenue totals above - skips pandas' per-call dispatch
+        avg_stay_len = bookings['stay_length'].to_numpy().mean()  # shorter var name
+        avg_party_sz = bookings['party_size'].to_numpy().mean()
         occ_rate = self._calculate_occupancy_rate(bookings)
         
         # Display KPIs in columns
@@ -248,8 +307,8 @@ class ResortOperationsDashboard:
                 st.markdown("### 📈 Revenue Scenarios")
                 
                 if 'revenue_scenarios' in optimization:
-                    total_potential = sum([scenario['revenue_uplift'] 
-                                         for scenario in optimization['revenue_scenarios'].values()])
+                    total_potential = sum(scenario['revenue_uplift'] 
+                                          for scenario in optimization['revenue_scenarios'].values())
                     
                     st.markdown(f"""
                     <div class="revenue-highlight">
@@ -267,6 +326,7 @@ class ResortOperationsDashboard:
     
     def render_guest_segmentation_analysis(self, analytics_summary):
         """Display guest segmentation insights"""
+        import plotly.express as px
         st.subheader("👥 Guest Segmentation Analysis")
         
         if analytics_summary and 'guest_segmentation' in analytics_summary:
@@ -291,6 +351,7 @@ class ResortOperationsDashboard:
                 fig_pie = px.pie(cluster_df, values='Size', names='Segment', 
                                title="Guest Segment Distribution")
                 fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+                fig_pie.update_layout(uniformtext_minsize=12, uniformtext_mode='hide')
                 st.plotly_chart(fig_pie, use_container_width=True)
             
             with col2:
@@ -320,15 +381,15 @@ class ResortOperationsDashboard:
         else:
             st.info("🔄 Guest segmentation analysis not available. Run guest analytics pipeline to see insights.")
     
-    def render_operational_performance(self, bookings, dining, amenities):
+    def render_operational_performance(self, bookings, monthly_df):
         """Display operational performance metrics"""
+        import plotly.express as px
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
         st.subheader("🏗️ Operational Performance Dashboard")
         
-        # Convert dates for time series analysis
-        bookings['checkin_date'] = pd.to_datetime(bookings['checkin_date'])
-        
         # Resort performance comparison
-        resort_metrics = bookings.groupby('resort_name').agg({
+        resort_metrics = bookings.groupby('resort_name', observed=True).agg({
             'total_cost': ['sum', 'mean', 'count'],
             'stay_length': 'mean',
             'party_size': 'mean'
@@ -338,6 +399,11 @@ class ResortOperationsDashboard:
                                 'Avg Stay Length', 'Avg Party Size']
         resort_metrics = resort_metrics.reset_index()
         
+        # Join capacity info on instead of looking it up per resort
+        resort_metrics = resort_metrics.merge(self._resort_df[['category', 'rooms']], how='left',
+                                              left_on='resort_name', right_index=True)
+        resort_metrics['Revenue per Room'] = (resort_metrics['Total Revenue'] / resort_metrics['rooms']).round(2)
+        
         # Resort performance visualization
         col1, col2 = st.columns(2)
         
@@ -349,7 +415,8 @@ class ResortOperationsDashboard:
                 y='Total Revenue',
                 title="Total Revenue by Resort",
                 color='Total Revenue',
-                color_continuous_scale='blues'
+                color_continuous_scale='blues',
+                hover_data=['category', 'rooms', 'Revenue per Room']
             )
             fig_resort_revenue.update_xaxes(tickangle=45)
             st.plotly_chart(fig_resort_revenue, use_container_width=True)
@@ -362,31 +429,31 @@ class ResortOperationsDashboard:
                 names='resort_name',
                 title="Booking Distribution by Resort"
             )
+            # Fixed percent-only labels; wedges too small to fit one just don't get a label
+            fig_bookings.update_traces(textposition='inside', textinfo='percent',
+                                       insidetextorientation='radial', textfont_size=12)
+            fig_bookings.update_layout(uniformtext_minsize=12, uniformtext_mode='hide')
             st.plotly_chart(fig_bookings, use_container_width=True)
         
         # Time series analysis
         st.markdown("### 📈 Booking Trends Over Time")
         
-        # Monthly booking trends
-        monthly_bookings = bookings.set_index('checkin_date').resample('M').agg({
-            'total_cost': 'sum',
-            'booking_id': 'count'
-        }).reset_index()
-        
-        monthly_bookings['month'] = monthly_bookings['checkin_date'].dt.strftime('%Y-%m')
+        # Monthly booking trends - precomputed rollup, only ~12 rows. Plain arrays for the traces so
+        # plotly doesn't have to unwrap a Series for each one
+        months = monthly_df['checkin_month'].dt.strftime('%Y-%m').to_numpy()
         
         fig_trends = make_subplots(specs=[[{"secondary_y": True}]])
         
         # Revenue trend
         fig_trends.add_trace(
-            go.Scatter(x=monthly_bookings['month'], y=monthly_bookings['total_cost'], 
+            go.Scatter(x=months, y=monthly_df['revenue'].to_numpy(), 
                       name="Revenue", line=dict(color='blue')),
             secondary_y=False,
         )
         
         # Booking count trend
         fig_trends.add_trace(
-            go.Scatter(x=monthly_bookings['month'], y=monthly_bookings['booking_id'], 
+            go.Scatter(x=months, y=monthly_df['bookings'].to_numpy(), 
                       name="Bookings", line=dict(color='red')),
             secondary_y=True,
         )
@@ -400,21 +467,23 @@ class ResortOperationsDashboard:
     
     def render_dining_amenity_analytics(self, dining, amenities):
         """Display dining and amenity performance"""
+        import plotly.express as px
         st.subheader("🍽️ Dining & Amenity Analytics")
         
+        restaurant_revenue, dining_by_time = dining_aggregates(dining)
+        amenity_performance = amenity_aggregates(amenities)
+        
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("#### Restaurant Performance")
-            restaurant_performance = dining.groupby('restaurant_name').agg({
-                'estimated_cost': ['sum', 'mean', 'count']
-            }).round(2)
-            
-            restaurant_performance.columns = ['Total Revenue', 'Avg Cost', 'Reservations']
-            restaurant_performance = restaurant_performance.reset_index()
             
-            # Top restaurants by revenue
-            top_restaurants = restaurant_performance.nlargest(5, 'Total Revenue')
+            # Top restaurants by revenue - partial sort, only the top 5 get ordered
+            revenue_values = restaurant_revenue.to_numpy()
+            top_n = min(5, len(revenue_values))
+            top_idx = np.argpartition(revenue_values, -top_n)[-top_n:] if top_n else []
+            top_restaurants = restaurant_revenue.iloc[top_idx].sort_values(ascending=False)
+            top_restaurants = top_restaurants.rename('Total Revenue').reset_index()
             
             fig_restaurants = px.bar(
                 top_restaurants,
@@ -429,13 +498,6 @@ class ResortOperationsDashboard:
         
         with col2:
             st.markdown("#### Amenity Utilization")
-            amenity_performance = amenities.groupby('amenity_type').agg({
-                'cost': ['sum', 'mean', 'count'],
-                'duration_minutes': 'mean'
-            }).round(2)
-            
-            amenity_performance.columns = ['Total Revenue', 'Avg Cost', 'Usage Count', 'Avg Duration']
-            amenity_performance = amenity_performance.reset_index()
             
             fig_amenities = px.scatter(
                 amenity_performance,
@@ -450,14 +512,13 @@ class ResortOperationsDashboard:
         
         # Dining patterns by time
         st.markdown("#### Dining Patterns")
-        dining_by_time = dining.groupby('meal_time')['estimated_cost'].agg(['sum', 'count']).reset_index()
-        dining_by_time.columns = ['Meal Time', 'Revenue', 'Reservations']
         
         col_a, col_b = st.columns(2)
         
         with col_a:
             fig_meal_revenue = px.pie(dining_by_time, values='Revenue', names='Meal Time',
                                     title="Revenue Distribution by Meal Time")
+            fig_meal_revenue.update_traces(textinfo='percent', textfont_size=12)
             st.plotly_chart(fig_meal_revenue, use_container_width=True)
         
         with col_b:
@@ -468,6 +529,7 @@ class ResortOperationsDashboard:
     
     def render_predictive_insights(self, analytics_summary):
         """Display predictive model insights"""
+        import plotly.express as px
         st.subheader("🔮 Predictive Analytics Insights")
         
         if analytics_summary:
@@ -480,17 +542,19 @@ class ResortOperationsDashboard:
                     st.info(f"**Model Accuracy**: {satisfaction_perf.get('accuracy', 0):.1%}")
                     
                     if 'feature_importance' in satisfaction_perf:
-                        # Feature importance chart
-                        features_df = pd.DataFrame(satisfaction_perf['feature_importance'])
+                        # Feature importance chart - training job writes the sorted top 8, older summaries just get sliced
+                        features = satisfaction_perf.get('feature_importance_top8',
+                                                         satisfaction_perf['feature_importance'][:8])
+                        importances = [f['importance'] for f in features]
                         
                         fig_features = px.bar(
-                            features_df.head(8), 
-                            x='importance', 
-                            y='feature',
+                            x=importances, 
+                            y=[f['feature'] for f in features],
                             orientation='h',
                             title="Top Factors Affecting Guest Satisfaction",
-                            color='importance',
-                            color_continuous_scale='viridis'
+                            color=importances,
+                            color_continuous_scale='viridis',
+                            labels={'x': 'importance', 'y': 'feature', 'color': 'importance'}
                         )
                         st.plotly_chart(fig_features, use_container_width=True)
             
@@ -503,16 +567,18 @@ class ResortOperationsDashboard:
                     
                     if 'feature_importance' in spending_perf:
                         # Spending prediction features
-                        spend_features_df = pd.DataFrame(spending_perf['feature_importance'])
+                        spend_features = spending_perf.get('feature_importance_top6',
+                                                           spending_perf['feature_importance'][:6])
+                        spend_importances = [f['importance'] for f in spend_features]
                         
                         fig_spend_features = px.bar(
-                            spend_features_df.head(6), 
-                            x='importance', 
-                            y='feature',
+                            x=spend_importances, 
+                            y=[f['feature'] for f in spend_features],
                             orientation='h',
                             title="Top Factors Affecting Guest Spending",
-                            color='importance',
-                            color_continuous_scale='reds'
+                            color=spend_importances,
+                            color_continuous_scale='reds',
+                            labels={'x': 'importance', 'y': 'feature', 'color': 'importance'}
                         )
                         st.plotly_chart(fig_spend_features, use_container_width=True)
             
@@ -534,9 +600,7 @@ class ResortOperationsDashboard:
         
         # Date range filter
         if not bookings.empty:
-            bookings['checkin_date'] = pd.to_datetime(bookings['checkin_date'])
-            min_date = bookings['checkin_date'].min().date()
-            max_date = bookings['checkin_date'].max().date()
+            min_date, max_date = checkin_date_bounds(bookings, len(bookings))
             
             st.sidebar.subheader("📅 Date Range")
             date_range = st.sidebar.date_input(
@@ -548,7 +612,7 @@ class ResortOperationsDashboard:
         
         # Resort filter
         st.sidebar.subheader("🏨 Resort Selection")
-        resort_options = ['All Resorts'] + list(self.resort_info.keys())
+        resort_options = ['All Resorts'] + self._resort_df.index.tolist()
         selected_resorts = st.sidebar.multiselect(
             "Choose Resorts",
             resort_options,
@@ -569,9 +633,11 @@ class ResortOperationsDashboard:
         # Dashboard refresh
         st.sidebar.subheader("🔄 Data Management")
         if st.sidebar.button("Refresh All Data"):
-            st.cache_data.clear()
-            st.success("✅ Dashboard data refreshed!")
-            time.sleep(1)
+            self.load_resort_data.clear()
+            checkin_date_bounds.clear()
+            _occupancy_rate.clear()
+            # A toast survives the rerun, so the session isn't held for a second just to show the message
+            st.toast("✅ Dashboard data refreshed!")
             st.rerun()
         
         # Export options
@@ -585,20 +651,15 @@ class ResortOperationsDashboard:
         if bookings.empty:
             return 0.0
         
-        # TODO: this calculation doesn't account for different room types properly
-        total_rooms = sum([info['rooms'] for info in self.resort_info.values()])
-        total_room_nights = bookings['stay_length'].sum()
-        total_capacity = total_rooms * len(bookings['checkin_date'].unique()) if len(bookings) > 0 else total_rooms
-        
-        occ_rate = total_room_nights / total_capacity if total_capacity > 0 else 0
-        return min(occ_rate, 1.0)  # cap at 100%
+        return _occupancy_rate(bookings, int(self._resort_df['rooms'].sum()))
 
 def main():
     """Main dashboard application"""
     dashboard = ResortOperationsDashboard()
     
     # Load data
-    bookings, guests, dining, amenities, analytics_df, analytics_summary, revenue_summary = dashboard.load_resort_data()
+    (bookings, guests, dining, amenities, monthly_df,
+     analytics_df, analytics_summary, revenue_summary) = dashboard.load_resort_data()
     
     # Render dashboard
     dashboard.render_dashboard_header()
@@ -618,7 +679,7 @@ def main():
         dashboard.render_guest_segmentation_analysis(analytics_summary)
         
         # Operational performance
-        dashboard.render_operational_performance(bookings, dining, amenities)
+        dashboard.render_operational_performance(bookings, monthly_df)
         
         # Dining and amenity analytics
         dashboard.render_dining_amenity_analytics(dining, amenities)
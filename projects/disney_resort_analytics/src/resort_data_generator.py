@@ -10,10 +10,9 @@ NOTE: Some of the amenity pricing might be off - haven't validated against real
 
 import pandas as pd
 import numpy as np
-import random
 from datetime import datetime, timedelta, date
-from typing import Dict, List, Tuple, Optional
-import json
+from typing import Dict, List, Tuple
+import orjson
 from pathlib import Path
 import logging
 
@@ -37,8 +36,7 @@ class DisneyResortDataGenerator:
         self.raw_path.mkdir(parents=True, exist_ok=True)
         self.processed_path.mkdir(parents=True, exist_ok=True)
         
-        # Set seeds so we get consistent data each run
-        random.seed(42)
+        # Set seed so we get consistent data each run - every draw goes through np.random
         np.random.seed(42)
         # TODO: make the seed configurable?
         
@@ -258,284 +256,357 @@ class DisneyResortDataGenerator:
             'concierge': {'base_cost': 0, 'duration': 15, 'satisfaction_impact': 0.2}
         }
         
+        # Seasonal demand by month number (index 0 unused) - holidays Nov-Jan 1.6, summer 1.4,
+        # spring break Mar/Apr 1.2, everything else off-peak 0.8
+        self.seasonal_demand_by_month = [0.0, 1.6, 0.8, 1.2, 1.2, 0.8, 1.4, 1.4, 1.4, 0.8, 0.8, 1.6, 1.6]
+        
+        # Per-booking lookups as flat arrays, built once instead of walking the config dicts for every booking
+        self.resort_names = np.array(list(self.resorts.keys()), dtype=object)
+        self.resort_base_rates = np.array([resort['base_rate'] for resort in self.resorts.values()])
+        self.resort_categories = np.array([resort['category'] for resort in self.resorts.values()], dtype=object)
+        self.fallback_resort_idx = list(self.resorts).index('Pop Century')  # when nothing fits the budget
+        self.room_type_names = np.array(list(self.room_types.keys()), dtype=object)
+        self.room_type_probabilities = [rt['probability'] for rt in self.room_types.values()]
+        self.room_rate_multipliers = np.array([rt['rate_multiplier'] for rt in self.room_types.values()])
+        self.restaurant_names = np.array(list(self.restaurants.keys()), dtype=object)
+        self.restaurant_resorts = np.array([rest['resort'] for rest in self.restaurants.values()], dtype=object)
+        self.restaurant_avg_costs = np.array([rest['avg_cost_pp'] for rest in self.restaurants.values()])
+        self.restaurant_cuisines = np.array([rest['cuisine'] for rest in self.restaurants.values()], dtype=object)
+        self.restaurant_price_ranges = np.array([rest['price_range'] for rest in self.restaurants.values()], dtype=object)
+        self.amenity_names = np.array(list(self.amenities.keys()), dtype=object)
+        self.amenity_base_costs = np.array([amenity['base_cost'] for amenity in self.amenities.values()])
+        self.amenity_durations = np.array([amenity['duration'] for amenity in self.amenities.values()])
+        self.amenity_satisfaction_impacts = np.array([amenity['satisfaction_impact'] for amenity in self.amenities.values()])
+        
+        # Each resort's amenities as positions in amenity_names, one row per resort - -1 for resort features
+        # that aren't bookable services (beach, luau...) and for padding, those never get a usage record
+        max_amenities = max(len(resort['amenities']) for resort in self.resorts.values())
+        self.resort_amenity_idx = np.array([
+            np.pad(pd.Index(self.amenity_names).get_indexer(resort['amenities']),
+                   (0, max_amenities - len(resort['amenities'])), constant_values=-1)
+            for resort in self.resorts.values()
+        ])
+        
+        self.segment_names = pd.Index(list(self.guest_segments.keys()))
+        
+        # Which restaurants match each segment's preferences, by restaurant type or cuisine - a segments x restaurants
+        # matrix, rows in segment_names order
+        self.restaurant_preference_match = np.array([
+            [any(pref in rest['type'].lower() or pref in rest['cuisine'].lower() for pref in segment['preferences'])
+             for rest in self.restaurants.values()]
+            for segment in self.guest_segments.values()
+        ])
+        
+        # Which amenities each segment lists as a preference - segments x amenities
+        self.amenity_preference_match = np.array([
+            [amenity in segment['preferences'] for amenity in self.amenity_names]
+            for segment in self.guest_segments.values()
+        ])
+        
+        # Expected daily dining reservations for every (segment, resort) pair - base rate by segment,
+        # adjusted by resort category. Segments x resorts matrix, indexed by segment and resort position
+        segment_dining_frequency = {
+            'Young Couples': 1.5,
+            'Families with Toddlers': 2.0,
+            'Families with Teens': 1.8,
+            'Multi-Generation': 2.2,
+            'Empty Nesters': 1.7,
+            'Business Travelers': 1.0,
+            'International Families': 2.5
+        }
+        category_adjustment = {'Deluxe Villa': 1.2, 'Value': 0.7}
+        self.dining_frequency = np.array([
+            [segment_dining_frequency.get(segment, 1.5) * category_adjustment.get(resort['category'], 1.0)
+             for resort in self.resorts.values()]
+            for segment in self.guest_segments
+        ])
+        
     def generate_guest_profiles(self, num_guests: int = 5000) -> pd.DataFrame:
         """Generate diverse guest profiles with realistic demographics"""
         logger.info(f"🏨 Generating {num_guests} guest profiles...")
         
-        profiles = []
-        guest_id = 10000
+        segment_names = list(self.guest_segments.keys())
+        segments = list(self.guest_segments.values())
         
-        for _ in range(num_guests):
-            # Select guest segment
-            segment_name = np.random.choice(
-                list(self.guest_segments.keys()),
-                p=[seg['probability'] for seg in self.guest_segments.values()]
-            )
-            segment = self.guest_segments[segment_name]
-            
-            # Generate demographics
-            lead_guest_age = np.random.randint(segment['age_range'][0], segment['age_range'][1])
-            party_size = np.random.randint(segment['party_size'][0], segment['party_size'][1] + 1)
-            budget = np.random.uniform(segment['budget_range'][0], segment['budget_range'][1])
-            
-            # Generate preferences and characteristics
-            loyalty_tier = np.random.choice(['None', 'Silver', 'Gold', 'Platinum'], 
-                                          p=[0.4, 0.3, 0.2, 0.1])
-            
-            previous_visits = np.random.poisson(2) if loyalty_tier != 'None' else np.random.poisson(0.5)
-            
-            # Special needs/accessibility
-            accessibility_needs = np.random.choice([True, False], p=[0.15, 0.85])
-            
-            # Celebration status
-            celebration = np.random.choice([None, 'Birthday', 'Anniversary', 'Honeymoon', 'Graduation'],
-                                         p=[0.7, 0.1, 0.08, 0.07, 0.05])
-            
-            profiles.append({
-                'guest_id': guest_id,
-                'segment': segment_name,
-                'lead_guest_age': lead_guest_age,
-                'party_size': party_size,
-                'annual_budget': int(budget),
-                'loyalty_tier': loyalty_tier,
-                'previous_visits': previous_visits,
-                'accessibility_needs': accessibility_needs,
-                'celebration': celebration,
-                'preferences': segment['preferences'],
-                'avg_stay_length': np.random.uniform(segment['stay_length'][0], segment['stay_length'][1]),
-                'price_sensitivity': np.random.uniform(0.3, 0.9),  # Higher = more price sensitive
-                'service_expectations': np.random.uniform(0.5, 1.0)  # Higher = higher expectations
-            })
-            
-            guest_id += 1
+        # Draw each attribute for every guest in one call - per-segment ranges are picked out by segment index
+        segment_idx = np.random.choice(len(segments), size=num_guests, p=[seg['probability'] for seg in segments])
+        
+        def segment_bounds(key):
+            bounds = np.array([seg[key] for seg in segments])[segment_idx]
+            return bounds[:, 0], bounds[:, 1]
+        
+        # Generate demographics
+        age_low, age_high = segment_bounds('age_range')
+        party_low, party_high = segment_bounds('party_size')
+        lead_guest_age = np.random.randint(age_low, age_high)
+        party_size = np.random.randint(party_low, party_high + 1)
+        budget = np.random.uniform(*segment_bounds('budget_range'))
+        
+        # Generate preferences and characteristics
+        loyalty_tier = np.random.choice(['None', 'Silver', 'Gold', 'Platinum'], size=num_guests,
+                                      p=[0.4, 0.3, 0.2, 0.1])
+        
+        previous_visits = np.random.poisson(np.where(loyalty_tier != 'None', 2, 0.5))
+        
+        # Special needs/accessibility
+        accessibility_needs = np.random.choice([True, False], size=num_guests, p=[0.15, 0.85])
+        
+        # Celebration status
+        celebration = np.random.choice(np.array([None, 'Birthday', 'Anniversary', 'Honeymoon', 'Graduation'], dtype=object),
+                                     size=num_guests, p=[0.7, 0.1, 0.08, 0.07, 0.05])
+        
+        profiles = {
+            'guest_id': np.arange(10000, 10000 + num_guests),
+            'segment': np.array(segment_names, dtype=object)[segment_idx],
+            'lead_guest_age': lead_guest_age,
+            'party_size': party_size,
+            'annual_budget': budget.astype(int),
+            'loyalty_tier': loyalty_tier.astype(object),
+            'previous_visits': previous_visits,
+            'accessibility_needs': accessibility_needs,
+            'celebration': celebration,
+            'preferences': [segments[i]['preferences'] for i in segment_idx],
+            'avg_stay_length': np.random.uniform(*segment_bounds('stay_length')),
+            'price_sensitivity': np.random.uniform(0.3, 0.9, size=num_guests),  # Higher = more price sensitive
+            'service_expectations': np.random.uniform(0.5, 1.0, size=num_guests)  # Higher = higher expectations
+        }
         
         df = pd.DataFrame(profiles)
         logger.info(f"✅ Generated guest profiles: {len(df)} records")
         return df
     
     def generate_bookings(self, guest_profiles: pd.DataFrame, months: int = 12) -> pd.DataFrame:
-        """Generate booking data - this method does a lot, probably too much"""
+        """Generate booking data - each field is drawn for every booking in one call, no per-booking records"""
         logger.info(f"📅 Generating {months} months of booking data...")
         # print(f"DEBUG: Got {len(guest_profiles)} guest profiles to work with")
         
-        bookings = []
-        booking_id = 50000  # arbitrary starting point
         start_dt = datetime.now() - timedelta(days=months * 30)
+        start_day = np.datetime64(start_dt.date(), 'D')
         
-        # Generate seasonal booking patterns
-        for month_offset in range(months):
-            current_month = start_dt + timedelta(days=month_offset * 30)
-            
-            # Seasonal demand multipliers
-            seasonal_demand = self._get_seasonal_demand(current_month)
-            
-            # Generate bookings for this month - 500 base is kinda arbitrary
-            monthly_bookings = int(500 * seasonal_demand * np.random.uniform(0.8, 1.2))
-            # if month_offset < 3:  # debug for first few months
-            #     print(f"Month {month_offset}: {monthly_bookings} bookings, demand={seasonal_demand}")
-            
-            for _ in range(monthly_bookings):
-                # Select guest
-                guest = guest_profiles.sample(1).iloc[0]
-                
-                # Generate booking details
-                booking_data = self._create_booking_record(booking_id, guest, current_month)
-                bookings.append(booking_data)
-                booking_id += 1
-        
-        df = pd.DataFrame(bookings)
-        logger.info(f"✅ Generated bookings: {len(df)} records")
-        return df
-    
-    def _create_booking_record(self, booking_id: int, guest: pd.Series, month: datetime) -> Dict:
-        """Create individual booking record with realistic patterns"""
+        # Pricing only depends on the check-in day - one multiplier per calendar day, indexed by day offset
+        pricing_calendar = self._get_pricing_multipliers(pd.DatetimeIndex(start_day + np.arange(months * 30 + 28)))
+        
+        # Generate seasonal booking patterns - 500 base per month is kinda arbitrary
+        seasonal_demand = self._get_seasonal_demand(pd.DatetimeIndex(start_day + np.arange(months) * 30))
+        monthly_bookings = (500 * seasonal_demand * np.random.uniform(0.8, 1.2, size=months)).astype(int)
+        month_offset = np.repeat(np.arange(months), monthly_bookings)
+        num_bookings = len(month_offset)
+        
+        # Select guests
+        guest_idx = np.random.randint(len(guest_profiles), size=num_bookings)
+        segment = guest_profiles['segment'].to_numpy()[guest_idx]
+        loyalty_tier = guest_profiles['loyalty_tier'].to_numpy()[guest_idx]
         
-        # Select resort based on guest segment and budget
-        suitable_resorts = self._filter_resorts_by_budget_and_preferences(guest)
-        resort_name = np.random.choice(suitable_resorts)
-        resort = self.resorts[resort_name]
+        # Select resort based on guest budget - uniform pick among the resorts each guest can afford
+        daily_budget = (guest_profiles['annual_budget'] / (guest_profiles['avg_stay_length'] * 4)).to_numpy()[guest_idx]  # Assume 4 trips per year
+        resort_idx = self._pick_uniform(self.resort_base_rates <= daily_budget[:, None] * 1.5)  # Allow some flexibility
+        resort_idx[resort_idx < 0] = self.fallback_resort_idx
         
         # Select room type
-        room_type = np.random.choice(
-            list(self.room_types.keys()),
-            p=[rt['probability'] for rt in self.room_types.values()]
-        )
+        room_idx = np.random.choice(len(self.room_type_names), size=num_bookings, p=self.room_type_probabilities)
         
         # Generate stay dates
-        stay_length = max(1, int(np.random.normal(guest['avg_stay_length'], 1)))
+        stay_length = np.maximum(1, np.random.normal(guest_profiles['avg_stay_length'].to_numpy()[guest_idx], 1).astype(int))
         
-        # Booking timing (advance booking patterns)
-        days_advance = self._generate_booking_advance_days(guest['segment'], resort['category'])
-        booking_date = month - timedelta(days=days_advance)
-        checkin_date = month + timedelta(days=np.random.randint(0, 28))
-        checkout_date = checkin_date + timedelta(days=stay_length)
+        # Booking timing (advance booking patterns) - business trips are last minute, villas and international trips planned far out
+        advance_pattern = [segment == 'Business Travelers', self.resort_categories[resort_idx] == 'Deluxe Villa',
+                           segment == 'International Families']
+        days_advance = np.random.randint(np.select(advance_pattern, [1, 60, 90], 30),
+                                         np.select(advance_pattern, [30, 365, 240], 180))
+        checkin_offset = month_offset * 30 + np.random.randint(0, 28, size=num_bookings)
         
         # Pricing calculation - this got complex over time
-        base_rate = resort['base_rate']
-        room_mult = self.room_types[room_type]['rate_multiplier']
-        seasonal_mult = self._get_pricing_multiplier(checkin_date)
-        
-        daily_rate = base_rate * room_mult * seasonal_mult
+        seasonal_mult = pricing_calendar[checkin_offset]
+        daily_rate = self.resort_base_rates[resort_idx] * self.room_rate_multipliers[room_idx] * seasonal_mult
         
         # Dynamic pricing adjustments - should probably be more sophisticated
-        if guest['loyalty_tier'] in ['Gold', 'Platinum']:
-            daily_rate *= 0.9  # 10% loyalty discount
+        is_gold_or_platinum = np.isin(loyalty_tier, ['Gold', 'Platinum'])
+        daily_rate = np.where(is_gold_or_platinum, daily_rate * 0.9, daily_rate)  # 10% loyalty discount
         
         total_cost = daily_rate * stay_length  # simple multiplication for now
         
         # Booking channel
-        channel = np.random.choice(['Direct Website', 'Disney App', 'Travel Agent', 'Phone'],
-                                 p=[0.45, 0.25, 0.2, 0.1])
+        channel = np.random.choice(np.array(['Direct Website', 'Disney App', 'Travel Agent', 'Phone'], dtype=object),
+                                   size=num_bookings, p=[0.45, 0.25, 0.2, 0.1])
         
         # Payment and booking characteristics
-        is_refundable = np.random.choice([True, False], p=[0.7, 0.3])
-        special_requests = self._generate_special_requests(guest)
-        
-        return {
-            'booking_id': booking_id,
-            'guest_id': guest['guest_id'],
-            'resort_name': resort_name,
-            'room_type': room_type,
-            'booking_date': booking_date.strftime('%Y-%m-%d'),
-            'checkin_date': checkin_date.strftime('%Y-%m-%d'),
-            'checkout_date': checkout_date.strftime('%Y-%m-%d'),
+        is_refundable = np.random.choice([True, False], size=num_bookings, p=[0.7, 0.3])
+        
+        # Standing requests come from the guest profile, worked out once per guest; upgrade asks are per booking
+        guest_requests = [self._generate_special_requests(guest) for guest in guest_profiles.to_dict('records')]
+        wants_upgrade = is_gold_or_platinum & (np.random.random(num_bookings) < 0.3)
+        special_requests = [guest_requests[g] + ['room_upgrade_request'] if upgrade else list(guest_requests[g])
+                            for g, upgrade in zip(guest_idx, wants_upgrade)]
+        
+        checkin_date = start_day + checkin_offset
+        
+        df = pd.DataFrame({
+            'booking_id': np.arange(50000, 50000 + num_bookings),  # arbitrary starting point
+            'guest_id': guest_profiles['guest_id'].to_numpy()[guest_idx],
+            'resort_name': self.resort_names[resort_idx],
+            'room_type': self.room_type_names[room_idx],
+            'booking_date': (start_day + month_offset * 30 - days_advance).astype(str),
+            'checkin_date': checkin_date.astype(str),
+            'checkout_date': (checkin_date + stay_length).astype(str),
             'stay_length': stay_length,
-            'daily_rate': round(daily_rate, 2),
-            'total_cost': round(total_cost, 2),
-            'party_size': guest['party_size'],
+            'daily_rate': daily_rate.round(2),
+            'total_cost': total_cost.round(2),
+            'party_size': guest_profiles['party_size'].to_numpy()[guest_idx],
             'booking_channel': channel,
             'is_refundable': is_refundable,
             'special_requests': special_requests,
             'days_advance_booked': days_advance,
-            'seasonal_multiplier': round(seasonal_mult, 2)  # keep track for analysis
-        }
+            'seasonal_multiplier': seasonal_mult.round(2)  # keep track for analysis
+        })
+        logger.info(f"✅ Generated bookings: {len(df)} records")
+        return df
     
     def generate_dining_reservations(self, bookings: pd.DataFrame, guest_profiles: pd.DataFrame) -> pd.DataFrame:
-        """Generate dining reservation patterns based on guest preferences and resort choice"""
+        """Generate dining reservation patterns based on guest preferences and resort choice
+        
+        Works on whole arrays - stay days, then meals, then restaurants and reservation details
+        are each drawn in one call instead of building a record per meal.
+        """
         logger.info("🍽️ Generating dining reservations...")
         
-        dining_reservations = []
-        reservation_id = 70000
+        booking_guests = guest_profiles.set_index('guest_id').loc[bookings['guest_id']]
+        segment_idx = self.segment_names.get_indexer(booking_guests['segment'])
+        resort_idx = pd.Index(self.resort_names).get_indexer(bookings['resort_name'])
+        stay_length = bookings['stay_length'].to_numpy()
+        calendar, calendar_index = self._build_stay_calendar(bookings)
+        checkin = np.array([calendar_index[day] for day in bookings['checkin_date']], dtype=int)
+        
+        # Determine dining frequency (meals per day)
+        dining_frequency = self.dining_frequency[segment_idx, resort_idx]
+        
+        # One row per stay day, then the meal count for every stay day in one draw
+        day_booking, day_of_stay = self._expand_stay_days(stay_length)
+        daily_meals = np.random.poisson(dining_frequency[day_booking])
+        meal_booking = np.repeat(day_booking, daily_meals)
+        meal_day = np.repeat(checkin[day_booking] + day_of_stay, daily_meals)
+        
+        # Select restaurant based on preferences and resort - meals with nowhere to eat are dropped
+        restaurant_idx = self._select_restaurants(segment_idx[meal_booking], resort_idx[meal_booking])
+        has_restaurant = restaurant_idx >= 0
+        booking_idx = meal_booking[has_restaurant]
+        restaurant_idx = restaurant_idx[has_restaurant]
+        num_reservations = len(booking_idx)
         
-        for _, booking in bookings.iterrows():
-            guest = guest_profiles[guest_profiles['guest_id'] == booking['guest_id']].iloc[0]
-            
-            # Determine dining frequency (meals per day)
-            dining_frequency = self._get_dining_frequency(guest['segment'], booking['resort_name'])
-            
-            checkin = pd.to_datetime(booking['checkin_date'])
-            stay_length = booking['stay_length']
-            
-            # Generate dining reservations for each day of stay
-            for day in range(stay_length):
-                current_date = checkin + timedelta(days=day)
-                daily_meals = np.random.poisson(dining_frequency)
-                
-                for meal in range(daily_meals):
-                    # Select restaurant based on preferences and resort
-                    restaurant = self._select_restaurant(guest, booking['resort_name'])
-                    
-                    if restaurant:
-                        dining_data = self._create_dining_reservation(
-                            reservation_id, booking, guest, restaurant, current_date
-                        )
-                        dining_reservations.append(dining_data)
-                        reservation_id += 1
-        
-        df = pd.DataFrame(dining_reservations)
+        # Generate reservation details
+        party_size = np.minimum(bookings['party_size'].to_numpy()[booking_idx], 8)  # Restaurant capacity limits
+        meal_time = np.random.choice(np.array(['Breakfast', 'Lunch', 'Dinner'], dtype=object),
+                                     size=num_reservations, p=[0.2, 0.3, 0.5])
+        
+        # Calculate cost
+        base_cost = self.restaurant_avg_costs[restaurant_idx] * party_size
+        
+        # Apply adjustments
+        celebrating = booking_guests['celebration'].notna().to_numpy()[booking_idx]
+        is_gold_or_platinum = booking_guests['loyalty_tier'].isin(['Gold', 'Platinum']).to_numpy()[booking_idx]
+        base_cost = np.where(celebrating, base_cost * 1.2, base_cost)  # Celebration surcharge
+        base_cost = np.where(is_gold_or_platinum, base_cost * 0.95, base_cost)  # Loyalty discount
+        
+        df = pd.DataFrame({
+            'reservation_id': np.arange(70000, 70000 + num_reservations),
+            'booking_id': bookings['booking_id'].to_numpy()[booking_idx],
+            'guest_id': bookings['guest_id'].to_numpy()[booking_idx],
+            'restaurant_name': self.restaurant_names[restaurant_idx],
+            'reservation_date': np.array(calendar, dtype=object)[meal_day[has_restaurant]],
+            'meal_time': meal_time,
+            'party_size': party_size,
+            'estimated_cost': base_cost.round(2),
+            'cuisine_type': self.restaurant_cuisines[restaurant_idx],
+            'price_range': self.restaurant_price_ranges[restaurant_idx]
+        })
         logger.info(f"✅ Generated dining reservations: {len(df)} records")
         return df
     
     def generate_amenity_usage(self, bookings: pd.DataFrame, guest_profiles: pd.DataFrame) -> pd.DataFrame:
-        """Generate amenity and service usage patterns"""
+        """Generate amenity and service usage patterns
+        
+        Every (stay day, amenity) slot across all bookings gets its use draw in one call, then the
+        usage details (duration, cost, loyalty discount) are worked out as whole columns.
+        """
         logger.info("🏊 Generating amenity usage data...")
         
-        amenity_usage = []
-        usage_id = 90000
+        booking_guests = guest_profiles.set_index('guest_id').loc[bookings['guest_id']]
+        segment_idx = self.segment_names.get_indexer(booking_guests['segment'])
+        resort_idx = pd.Index(self.resort_names).get_indexer(bookings['resort_name'])
+        calendar, calendar_index = self._build_stay_calendar(bookings)
+        checkin = np.array([calendar_index[day] for day in bookings['checkin_date']], dtype=int)
         
-        for _, booking in bookings.iterrows():
-            guest = guest_profiles[guest_profiles['guest_id'] == booking['guest_id']].iloc[0]
-            resort = self.resorts[booking['resort_name']]
-            
-            checkin = pd.to_datetime(booking['checkin_date'])
-            stay_length = booking['stay_length']
-            
-            # Generate amenity usage for each day
-            for day in range(stay_length):
-                current_date = checkin + timedelta(days=day)
-                
-                # Determine which amenities guest might use
-                for amenity in resort['amenities']:
-                    if amenity in guest['preferences']:
-                        use_probability = 0.4
-                    else:
-                        use_probability = 0.1
-                    
-                    if np.random.random() < use_probability:
-                        usage_data = self._create_amenity_usage_record(
-                            usage_id, booking, guest, amenity, current_date
-                        )
-                        amenity_usage.append(usage_data)
-                        usage_id += 1
-        
-        df = pd.DataFrame(amenity_usage)
+        # One row per stay day, one column per amenity at the guest's resort
+        day_booking, day_of_stay = self._expand_stay_days(bookings['stay_length'].to_numpy())
+        slot_amenity = self.resort_amenity_idx[resort_idx[day_booking]]
+        
+        # Determine which amenities guest might use
+        prefers = self.amenity_preference_match[segment_idx[day_booking][:, None], slot_amenity]
+        use_probability = np.where(prefers, 0.4, 0.1)
+        
+        # Only bookable services are recorded - nonzero walks the hits booking by booking, day by day
+        uses = (slot_amenity >= 0) & (np.random.random(slot_amenity.shape) < use_probability)
+        usage_row, usage_slot = np.nonzero(uses)
+        booking_idx = day_booking[usage_row]
+        amenity_idx = slot_amenity[usage_row, usage_slot]
+        num_usages = len(booking_idx)
+        
+        # Generate usage details
+        duration = np.random.normal(self.amenity_durations[amenity_idx], self.amenity_durations[amenity_idx] * 0.2)
+        
+        # Loyalty discounts
+        cost = self.amenity_base_costs[amenity_idx].astype(float)
+        is_gold_or_platinum = booking_guests['loyalty_tier'].isin(['Gold', 'Platinum']).to_numpy()[booking_idx]
+        cost = np.where(is_gold_or_platinum, cost * 0.9, cost)
+        
+        df = pd.DataFrame({
+            'usage_id': np.arange(90000, 90000 + num_usages),
+            'booking_id': bookings['booking_id'].to_numpy()[booking_idx],
+            'guest_id': bookings['guest_id'].to_numpy()[booking_idx],
+            'amenity_type': self.amenity_names[amenity_idx],
+            'usage_date': np.array(calendar, dtype=object)[checkin[booking_idx] + day_of_stay[usage_row]],
+            'duration_minutes': duration.astype(int),
+            'cost': cost.round(2),
+            'satisfaction_impact': self.amenity_satisfaction_impacts[amenity_idx]
+        })
         logger.info(f"✅ Generated amenity usage: {len(df)} records")
         return df
     
-    def _filter_resorts_by_budget_and_preferences(self, guest: pd.Series) -> List[str]:
-        """Filter resorts based on guest budget and preferences"""
-        suitable_resorts = []
-        daily_budget = guest['annual_budget'] / (guest['avg_stay_length'] * 4)  # Assume 4 trips per year
-        
-        for resort_name, resort in self.resorts.items():
-            if resort['base_rate'] <= daily_budget * 1.5:  # Allow some flexibility
-                suitable_resorts.append(resort_name)
-        
-        return suitable_resorts if suitable_resorts else ['Pop Century']  # Fallback
+    def _build_stay_calendar(self, bookings: pd.DataFrame) -> Tuple[List[str], Dict[str, int]]:
+        """Every date the stays cover as a YYYY-MM-DD string, plus each check-in date's position in that list
+        
+        Formatting each calendar day once is far cheaper than parsing check-in dates and
+        calling strftime for every dining/amenity record.
+        """
+        calendar = pd.date_range(bookings['checkin_date'].min(), bookings['checkout_date'].max()).strftime('%Y-%m-%d').tolist()
+        return calendar, {day: position for position, day in enumerate(calendar)}
     
-    def _get_seasonal_demand(self, date: datetime) -> float:
-        """Calculate seasonal demand multiplier"""
-        month = date.month
-        
-        # Peak seasons
-        if month in [6, 7, 8]:  # Summer
-            return 1.4
-        elif month in [11, 12, 1]:  # Holiday season
-            return 1.6
-        elif month in [3, 4]:  # Spring break
-            return 1.2
-        else:  # Off-peak
-            return 0.8
+    def _expand_stay_days(self, stay_length: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """One row per night of every stay - the booking position and the day number within the stay"""
+        day_booking = np.repeat(np.arange(len(stay_length)), stay_length)
+        day_of_stay = np.arange(len(day_booking)) - np.repeat(np.cumsum(stay_length) - stay_length, stay_length)
+        return day_booking, day_of_stay
     
-    def _get_pricing_multiplier(self, date: datetime) -> float:
-        """Calculate dynamic pricing multiplier based on demand"""
-        base_multiplier = self._get_seasonal_demand(date)
+    def _get_seasonal_demand(self, dates: pd.DatetimeIndex) -> np.ndarray:
+        """Calculate seasonal demand multiplier for each date"""
+        return np.asarray(self.seasonal_demand_by_month)[dates.month]
+    
+    def _get_pricing_multipliers(self, dates: pd.DatetimeIndex) -> np.ndarray:
+        """Calculate dynamic pricing multiplier for each date based on demand - whole calendar at once"""
+        month = dates.month.to_numpy()
+        base_multiplier = self._get_seasonal_demand(dates)
         
         # Weekend premium
-        if date.weekday() >= 5:
-            base_multiplier *= 1.2
+        base_multiplier = np.where(dates.weekday.to_numpy() >= 5, base_multiplier * 1.2, base_multiplier)
         
         # Special events (simplified)
-        if date.month == 10:  # Halloween season
-            base_multiplier *= 1.1
-        elif date.month == 12 and date.day > 20:  # Christmas week
-            base_multiplier *= 1.5
+        base_multiplier = np.where(month == 10, base_multiplier * 1.1, base_multiplier)  # Halloween season
+        christmas_week = (month == 12) & (dates.day.to_numpy() > 20)
+        base_multiplier = np.where(christmas_week, base_multiplier * 1.5, base_multiplier)
         
         return base_multiplier
     
-    def _generate_booking_advance_days(self, segment: str, resort_category: str) -> int:
-        """Generate realistic booking advance patterns"""
-        if segment == 'Business Travelers':
-            return np.random.randint(1, 30)
-        elif resort_category == 'Deluxe Villa':
-            return np.random.randint(60, 365)
-        elif segment == 'International Families':
-            return np.random.randint(90, 240)
-        else:
-            return np.random.randint(30, 180)
-    
-    def _generate_special_requests(self, guest: pd.Series) -> List[str]:
-        """Generate realistic special requests"""
+    def _generate_special_requests(self, guest: Dict) -> List[str]:
+        """Special requests that come from the guest profile - room upgrade asks are drawn per booking"""
         requests = []
         
         if guest['celebration']:
@@ -547,113 +618,43 @@ class DisneyResortDataGenerator:
         if 'childcare' in guest['preferences']:
             requests.append('crib_needed')
         
-        if guest['loyalty_tier'] in ['Gold', 'Platinum']:
-            if np.random.random() < 0.3:
-                requests.append('room_upgrade_request')
-        
         return requests
     
-    def _get_dining_frequency(self, segment: str, resort_name: str) -> float:
-        """Calculate expected daily dining reservations"""
-        base_frequency = {
-            'Young Couples': 1.5,
-            'Families with Toddlers': 2.0,
-            'Families with Teens': 1.8,
-            'Multi-Generation': 2.2,
-            'Empty Nesters': 1.7,
-            'Business Travelers': 1.0,
-            'International Families': 2.5
-        }
-        
-        frequency = base_frequency.get(segment, 1.5)
-        
-        # Resort category adjustment
-        resort_category = self.resorts[resort_name]['category']
-        if resort_category == 'Deluxe Villa':
-            frequency *= 1.2
-        elif resort_category == 'Value':
-            frequency *= 0.7
-        
-        return frequency
+    def _pick_uniform(self, candidates: np.ndarray) -> np.ndarray:
+        """Pick one True column per row of a boolean matrix, uniformly - -1 for rows with no candidates"""
+        num_candidates = candidates.sum(axis=1)
+        pick = (np.random.random(len(candidates)) * num_candidates).astype(int)
+        picked = np.argmax(candidates.cumsum(axis=1) > pick[:, None], axis=1)
+        picked[num_candidates == 0] = -1
+        return picked
     
-    def _select_restaurant(self, guest: pd.Series, resort_name: str) -> Optional[str]:
-        """Select restaurant based on guest preferences and location"""
-        # Filter restaurants by location and preferences
-        suitable_restaurants = []
+    def _select_restaurants(self, segment_idx: np.ndarray, resort_idx: np.ndarray) -> np.ndarray:
+        """Select a restaurant for each meal based on guest preferences and location
         
-        for restaurant_name, restaurant in self.restaurants.items():
-            if restaurant['resort'] == resort_name or np.random.random() < 0.2:  # 20% chance of off-resort dining
-                # Check if restaurant type matches preferences
-                if any(pref in restaurant['type'].lower() or pref in restaurant['cuisine'].lower() 
-                      for pref in guest['preferences']):
-                    suitable_restaurants.append(restaurant_name)
+        Takes segment and resort positions per meal. Returns positions in restaurant_names,
+        -1 where the guest's resort has no restaurant to fall back on.
+        """
+        # Filter restaurants by location and preferences - a meals x restaurants mask
+        at_resort = self.resort_names[resort_idx][:, None] == self.restaurant_resorts
+        nearby = at_resort | (np.random.random(at_resort.shape) < 0.2)  # 20% chance of off-resort dining
+        suitable = nearby & self.restaurant_preference_match[segment_idx]
         
-        if suitable_restaurants:
-            return np.random.choice(suitable_restaurants)
+        restaurant_idx = self._pick_uniform(suitable)
         
         # Fallback to any restaurant at resort
-        resort_restaurants = [name for name, rest in self.restaurants.items() 
-                            if rest['resort'] == resort_name]
-        return np.random.choice(resort_restaurants) if resort_restaurants else None
+        no_match = restaurant_idx < 0
+        restaurant_idx[no_match] = self._pick_uniform(at_resort[no_match])
+        return restaurant_idx
     
-    def _create_dining_reservation(self, reservation_id: int, booking: Dict, guest: pd.Series, 
-                                 restaurant_name: str, date: datetime) -> Dict:
-        """Create dining reservation record"""
-        restaurant = self.restaurants[restaurant_name]
-        
-        # Generate reservation details
-        party_size = min(booking['party_size'], 8)  # Restaurant capacity limits
-        meal_time = np.random.choice(['Breakfast', 'Lunch', 'Dinner'], p=[0.2, 0.3, 0.5])
-        
-        # Calculate cost
-        base_cost = restaurant['avg_cost_pp'] * party_size
-        
-        # Apply adjustments
-        if guest['celebration']:
-            base_cost *= 1.2  # Celebration surcharge
-        
-        if guest['loyalty_tier'] in ['Gold', 'Platinum']:
-            base_cost *= 0.95  # Loyalty discount
-        
-        return {
-            'reservation_id': reservation_id,
-            'booking_id': booking['booking_id'],
-            'guest_id': booking['guest_id'],
-            'restaurant_name': restaurant_name,
-            'reservation_date': date.strftime('%Y-%m-%d'),
-            'meal_time': meal_time,
-            'party_size': party_size,
-            'estimated_cost': round(base_cost, 2),
-            'cuisine_type': restaurant['cuisine'],
-            'price_range': restaurant['price_range']
-        }
-    
-    def _create_amenity_usage_record(self, usage_id: int, booking: Dict, guest: pd.Series,
-                                   amenity: str, date: datetime) -> Dict:
-        """Create amenity usage record"""
-        if amenity not in self.amenities:
-            return None
-        
-        amenity_info = self.amenities[amenity]
-        
-        # Generate usage details
-        duration = int(np.random.normal(amenity_info['duration'], amenity_info['duration'] * 0.2))
-        cost = amenity_info['base_cost']
-        
-        # Loyalty discounts
-        if guest['loyalty_tier'] in ['Gold', 'Platinum'] and cost > 0:
-            cost *= 0.9
-        
-        return {
-            'usage_id': usage_id,
-            'booking_id': booking['booking_id'],
-            'guest_id': booking['guest_id'],
-            'amenity_type': amenity,
-            'usage_date': date.strftime('%Y-%m-%d'),
-            'duration_minutes': duration,
-            'cost': round(cost, 2) if cost > 0 else 0,
-            'satisfaction_impact': amenity_info['satisfaction_impact']
-        }
+    def build_monthly_bookings(self, bookings: pd.DataFrame) -> pd.DataFrame:
+        """Monthly revenue and booking counts keyed on check-in month"""
+        checkin = pd.to_datetime(bookings['checkin_date'])
+        monthly = bookings.set_index(checkin).resample('MS').agg(
+            revenue=('total_cost', 'sum'),
+            bookings=('booking_id', 'count')
+        )
+        monthly.index.name = 'checkin_month'
+        return monthly.reset_index()
     
     def save_datasets(self, guest_profiles: pd.DataFrame, bookings: pd.DataFrame, 
                      dining: pd.DataFrame, amenities: pd.DataFrame):
@@ -665,31 +666,37 @@ class DisneyResortDataGenerator:
             dining.to_csv(self.raw_path / 'dining_reservations.csv', index=False)
             amenities.to_csv(self.raw_path / 'amenity_usage.csv', index=False)
             
-            # Generate summary statistics
+            # Monthly rollup for the dashboard trend chart - done once here instead of on every dashboard load
+            self.build_monthly_bookings(bookings).to_parquet(self.processed_path / 'monthly_bookings.parquet', index=False)
+            
+            # Generate summary statistics - plain numpy reductions on each column, no pandas dispatch per stat
+            checkin_dates = bookings['checkin_date'].to_numpy()
+            checkout_dates = bookings['checkout_date'].to_numpy()
             summary = {
-                'generation_date': datetime.now().isoformat(),
+                'generation_date': datetime.now(),
                 'total_guests': len(guest_profiles),
                 'total_bookings': len(bookings),
                 'total_dining_reservations': len(dining),
                 'total_amenity_usage': len(amenities),
                 'date_range': {
-                    'start': bookings['checkin_date'].min(),
-                    'end': bookings['checkout_date'].max()
+                    'start': checkin_dates.min(),
+                    'end': checkout_dates.max()
                 },
                 'total_revenue': {
-                    'room_revenue': int(bookings['total_cost'].sum()),
-                    'dining_revenue': int(dining['estimated_cost'].sum()),
-                    'amenity_revenue': int(amenities['cost'].sum())
+                    'room_revenue': int(bookings['total_cost'].to_numpy().sum()),
+                    'dining_revenue': int(dining['estimated_cost'].to_numpy().sum()),
+                    'amenity_revenue': int(amenities['cost'].to_numpy().sum())
                 },
                 'average_metrics': {
-                    'stay_length': round(bookings['stay_length'].mean(), 2),
-                    'party_size': round(bookings['party_size'].mean(), 2),
-                    'advance_booking_days': round(bookings['days_advance_booked'].mean(), 1)
+                    'stay_length': round(float(bookings['stay_length'].to_numpy().mean()), 2),
+                    'party_size': round(float(bookings['party_size'].to_numpy().mean()), 2),
+                    'advance_booking_days': round(float(bookings['days_advance_booked'].to_numpy().mean()), 1)
                 }
             }
             
-            with open(self.raw_path / 'generation_summary.json', 'w') as f:
-                json.dump(summary, f, indent=2)
+            # orjson encodes the datetime/numpy values directly and the file goes out in a single write
+            (self.raw_path / 'generation_summary.json').write_bytes(
+                orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY, default=str))
             
             logger.info("✅ All datasets saved successfully")
             logger.info(f"📊 Generated {len(guest_profiles):,} guest profiles")
@@ -12,16 +12,16 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 import logging
-from datetime import datetime, timedelta, date
+from datetime import datetime, date
 from typing import Dict, List, Tuple, Optional
-import json
+import orjson
 import warnings
 
 # ML and optimization libraries
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-from sklearn.model_selection import train_test_split, TimeSeriesSplit
-from sklearn.preprocessing import StandardScaler
+from sklearn.ensemble import RandomForestRegressor, HistGradientBoostingRegressor
+from sklearn.model_selection import train_test_split, TimeSeriesSplit, cross_val_score
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from sklearn.inspection import permutation_importance
 from scipy.optimize import minimize
 import joblib
 
@@ -66,38 +66,56 @@ class RevenueOptimizationEngine:
             'Pop Century': {'rooms': 2880, 'base_rate': 150, 'category': 'Value'},
             'All Star Sports': {'rooms': 1920, 'base_rate': 125, 'category': 'Value'}
         }
+        
+        # Room capacity lookup table indexed by resort category code
+        self._resort_names = list(self.resort_info)
+        self._capacity_lut = np.array([self.resort_info[r]['rooms'] for r in self._resort_names], dtype=np.int32)
     
     def load_revenue_data(self) -> pd.DataFrame:
         """Load booking and guest data for revenue analysis"""
         try:
-            bookings = pd.read_csv(self.raw_path / 'resort_bookings.csv')
-            guests = pd.read_csv(self.raw_path / 'guest_profiles.csv')
-            dining = pd.read_csv(self.raw_path / 'dining_reservations.csv')
-            amenities = pd.read_csv(self.raw_path / 'amenity_usage.csv')
+            # Only read the columns the revenue models use, with compact dtypes and dates set at parse time
+            bookings = pd.read_csv(self.raw_path / 'resort_bookings.csv', engine='pyarrow',
+                                   usecols=['booking_id', 'guest_id', 'resort_name', 'room_type', 'checkin_date',
+                                            'checkout_date', 'stay_length', 'daily_rate', 'total_cost', 'party_size',
+                                            'days_advance_booked', 'seasonal_multiplier'],
+                                   dtype={'resort_name': 'category', 'room_type': 'category', 'stay_length': 'int8',
+                                          'daily_rate': 'float32', 'party_size': 'int8', 'days_advance_booked': 'int16',
+                                          'seasonal_multiplier': 'float32'},
+                                   parse_dates=['checkin_date', 'checkout_date'])
+            guests = pd.read_csv(self.raw_path / 'guest_profiles.csv', engine='pyarrow',
+                                 usecols=['guest_id', 'segment', 'loyalty_tier', 'annual_budget'],
+                                 dtype={'segment': 'category', 'loyalty_tier': 'category'})
+            dining = pd.read_csv(self.raw_path / 'dining_reservations.csv', engine='pyarrow',
+                                 usecols=['booking_id', 'estimated_cost'])
+            amenities = pd.read_csv(self.raw_path / 'amenity_usage.csv', engine='pyarrow',
+                                    usecols=['booking_id', 'cost'])
             
             # Merge for comprehensive revenue view
-            revenue_df = bookings.merge(guests[['guest_id', 'segment', 'loyalty_tier', 'annual_budget']], on='guest_id')
-            
-            # Add ancillary revenue
-            dining_revenue = dining.groupby('booking_id')['estimated_cost'].sum().reset_index()
-            dining_revenue.columns = ['booking_id', 'dining_revenue']
+            revenue_df = bookings.merge(guests, on='guest_id')
             
-            amenity_revenue = amenities.groupby('booking_id')['cost'].sum().reset_index()
-            amenity_revenue.columns = ['booking_id', 'amenity_revenue']
+            # Add ancillary revenue - join the per-booking sums on the booking_id index
+            dining_revenue = dining.groupby('booking_id', sort=False)['estimated_cost'].sum().rename('dining_revenue')
+            amenity_revenue = amenities.groupby('booking_id', sort=False)['cost'].sum().rename('amenity_revenue')
             
-            revenue_df = revenue_df.merge(dining_revenue, on='booking_id', how='left')
-            revenue_df = revenue_df.merge(amenity_revenue, on='booking_id', how='left')
+            revenue_df = revenue_df.set_index('booking_id').join([dining_revenue, amenity_revenue]).reset_index()
             
-            # Fill missing values
-            revenue_df['dining_revenue'] = revenue_df['dining_revenue'].fillna(0)
-            revenue_df['amenity_revenue'] = revenue_df['amenity_revenue'].fillna(0)
+            # Bookings without dining or amenity spend count as zero - fill and total on the raw arrays
+            dining_spend = np.nan_to_num(revenue_df['dining_revenue'].to_numpy(), nan=0.0)
+            amenity_spend = np.nan_to_num(revenue_df['amenity_revenue'].to_numpy(), nan=0.0)
+            revenue_df['dining_revenue'] = dining_spend
+            revenue_df['amenity_revenue'] = amenity_spend
             
             # Calculate total revenue per booking
-            revenue_df['total_revenue'] = revenue_df['total_cost'] + revenue_df['dining_revenue'] + revenue_df['amenity_revenue']
+            revenue_df['total_revenue'] = revenue_df['total_cost'].to_numpy() + dining_spend + amenity_spend
             
             logger.info(f"✅ Loaded revenue data: {len(revenue_df)} bookings, ${revenue_df['total_revenue'].sum():,.0f} total revenue")
             # print(f"DEBUG: Average revenue per booking: ${revenue_df['total_revenue'].mean():.2f}")
             return revenue_df
+            
+        except FileNotFoundError as e:
+            logger.error(f"❌ Revenue data files not found: {e}")
+            raise
     
     def _experimental_demand_elasticity(self, price_data):
         """Experimental demand elasticity calculation - not working yet"""
@@ -106,73 +124,74 @@ class RevenueOptimizationEngine:
         pass
         # elasticity = np.log(quantity_change) / np.log(price_change)
         # return elasticity
-            
-        except FileNotFoundError as e:
-            logger.error(f"❌ Revenue data files not found: {e}")
-            raise
     
     def prepare_occupancy_data(self, revenue_df: pd.DataFrame) -> pd.DataFrame:
         """Prepare occupancy data - this method got pretty long"""
         logger.info("📊 Preparing occupancy forecasting dataset...")
-        # TODO: optimize this - it's slow with lots of data
-        
-        # Convert dates
-        revenue_df['checkin_date'] = pd.to_datetime(revenue_df['checkin_date'])
-        revenue_df['checkout_date'] = pd.to_datetime(revenue_df['checkout_date'])
-        
-        # Generate daily occupancy data - this loop is expensive but works
-        occupancy_records = []
-        
-        for _, booking in revenue_df.iterrows():
-            current_date = booking['checkin_date']
-            while current_date < booking['checkout_date']:
-                occupancy_records.append({
-                    'date': current_date,
-                    'resort_name': booking['resort_name'],
-                    'rooms_occupied': 1,
-                    'revenue': booking['total_revenue'] / booking['stay_length'],
-                    'room_rate': booking['daily_rate'],
-                    'guest_segment': booking['segment'],
-                    'loyalty_tier': booking['loyalty_tier'],
-                    'days_advance': booking['days_advance_booked'],
-                    'seasonal_multiplier': booking['seasonal_multiplier']
-                })
-                current_date += timedelta(days=1)
         
-        occupancy_df = pd.DataFrame(occupancy_records)
-        
-        # Aggregate by date and resort
-        daily_occupancy = occupancy_df.groupby(['date', 'resort_name']).agg({
-            'rooms_occupied': 'sum',
-            'revenue': 'sum',
-            'room_rate': 'mean',
-            'days_advance': 'mean',
-            'seasonal_multiplier': 'mean'
-        }).reset_index()
+        # Every nightly value is constant over a booking's stay, so accumulate them on a (day, resort) grid:
+        # add each booking at check-in, subtract it at checkout and cumulative-sum down the days.
+        # This gives the per-night sums without expanding bookings into one row per night.
+        booking_resorts, resorts = pd.factorize(revenue_df['resort_name'], sort=True)
+        checkin_days = revenue_df['checkin_date'].to_numpy().astype('datetime64[D]')
+        first_day = checkin_days.min()
+        nights = (revenue_df['checkout_date'] - revenue_df['checkin_date']).dt.days.clip(lower=0).to_numpy()
+        
+        checkin_offset = (checkin_days - first_day).astype(np.int64)
+        grid_shape = (int((checkin_offset + nights).max()) + 1, len(resorts))
+        checkin_cell = checkin_offset * len(resorts) + booking_resorts
+        checkout_cell = (checkin_offset + nights) * len(resorts) + booking_resorts
+        
+        def nightly_sum(values=None):
+            added = np.bincount(checkin_cell, weights=values, minlength=grid_shape[0] * grid_shape[1])
+            removed = np.bincount(checkout_cell, weights=values, minlength=grid_shape[0] * grid_shape[1])
+            return np.cumsum((added - removed).reshape(grid_shape), axis=0)
+        
+        # Keep only resort-days with at least one occupied room
+        rooms_occupied = nightly_sum()
+        day_idx, resort_idx = np.nonzero(rooms_occupied > 0)
+        nights_per_group = rooms_occupied[day_idx, resort_idx]
+        
+        def nightly_mean(values):
+            return nightly_sum(values)[day_idx, resort_idx] / nights_per_group
+        
+        daily_occupancy = pd.DataFrame({
+            'date': (first_day + day_idx.astype('timedelta64[D]')).astype('datetime64[ns]'),
+            'resort_name': resorts.to_numpy()[resort_idx],
+            'rooms_occupied': nights_per_group,
+            'revenue': nightly_sum((revenue_df['total_revenue'] / revenue_df['stay_length']).to_numpy())[day_idx, resort_idx],
+            'room_rate': nightly_mean(revenue_df['daily_rate'].to_numpy(np.float64)),
+            'days_advance': nightly_mean(revenue_df['days_advance_booked'].to_numpy(np.float64)),
+            'seasonal_multiplier': nightly_mean(revenue_df['seasonal_multiplier'].to_numpy(np.float64))
+        })
         
         # Add capacity and occupancy rate
-        daily_occupancy['total_rooms'] = daily_occupancy['resort_name'].map(
-            {resort: info['rooms'] for resort, info in self.resort_info.items()}
-        )
+        daily_occupancy['resort_name'] = pd.Categorical(daily_occupancy['resort_name'], categories=self._resort_names)
+        resort_codes = daily_occupancy['resort_name'].cat.codes.to_numpy()
+        daily_occupancy['total_rooms'] = np.where(resort_codes >= 0, self._capacity_lut[resort_codes], np.nan)
         daily_occupancy['occupancy_rate'] = daily_occupancy['rooms_occupied'] / daily_occupancy['total_rooms']
         daily_occupancy['occupancy_rate'] = daily_occupancy['occupancy_rate'].clip(0, 1)
         
-        # Add temporal features
-        daily_occupancy['day_of_week'] = daily_occupancy['date'].dt.dayofweek
-        daily_occupancy['month'] = daily_occupancy['date'].dt.month
-        daily_occupancy['day_of_year'] = daily_occupancy['date'].dt.dayofyear
-        daily_occupancy['is_weekend'] = (daily_occupancy['day_of_week'] >= 5).astype(int)
+        # Add temporal features - derived once from day-resolution datetimes (1970-01-01 was a Thursday)
+        days = daily_occupancy['date'].to_numpy().astype('datetime64[D]')
+        day_of_week = (days.view('int64') - 4) % 7
+        month = days.astype('datetime64[M]').astype(int) % 12 + 1
+        daily_occupancy['day_of_week'] = day_of_week
+        daily_occupancy['month'] = month
+        daily_occupancy['day_of_year'] = (days - days.astype('datetime64[Y]')).astype(int) + 1
+        daily_occupancy['is_weekend'] = (day_of_week >= 5).astype(int)
         
-        # Add holiday indicators (simplified)
-        daily_occupancy['is_holiday_period'] = daily_occupancy['month'].isin([6, 7, 8, 11, 12]).astype(int)
+        # Add holiday indicators (simplified) - Jun/Jul/Aug and Nov/Dec, indexed by month number
+        holiday_months = np.array([0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 1, 1])
+        daily_occupancy['is_holiday_period'] = holiday_months[month]
         
         logger.info(f"✅ Occupancy dataset prepared: {len(daily_occupancy)} resort-days")
         return daily_occupancy
     
     def build_occupancy_forecasting_model(self, occupancy_df: pd.DataFrame) -> Dict:
-        """Build occupancy forecasting models - one per resort"""
+        """Build occupancy forecasting model - one model across all resorts"""
         logger.info("🏨 Building occupancy forecasting model...")
-        # Note: tried different algorithms, GradientBoosting worked best
+        # Note: tried different algorithms, gradient boosting worked best - hist version fits much faster
         
         # Select features for occupancy prediction
         feature_columns = [
@@ -180,65 +199,58 @@ class RevenueOptimizationEngine:
             'is_holiday_period', 'seasonal_multiplier', 'days_advance'
         ]
         
-        # Build separate models for each resort - they have different patterns
-        models = {}
-        model_performance = {}
+        # Skip resorts with insufficient data
+        days_per_resort = occupancy_df['resort_name'].value_counts()
+        occupancy_df = occupancy_df[occupancy_df['resort_name'].isin(days_per_resort[days_per_resort >= 50].index)]
+        occupancy_df = occupancy_df.sort_values('date')
         
-        for resort_name in occupancy_df['resort_name'].unique():
-            resort_data = occupancy_df[occupancy_df['resort_name'] == resort_name].copy()
-            resort_data = resort_data.sort_values('date')
-            
-            if len(resort_data) < 50:  # Skip if insufficient data
-                continue
-            
-            # Prepare features and target
-            X = resort_data[feature_columns]
-            y = resort_data['occupancy_rate']
-            
-            # Time series split for validation
-            tscv = TimeSeriesSplit(n_splits=3)
-            
-            # Train model
-            model = GradientBoostingRegressor(n_estimators=100, random_state=42)
-            
-            # Cross-validation
-            cv_scores = []
-            for train_idx, test_idx in tscv.split(X):
-                X_train, X_test = X.iloc[train_idx], X.iloc[test_idx]
-                y_train, y_test = y.iloc[train_idx], y.iloc[test_idx]
-                
-                model.fit(X_train, y_train)
-                y_pred = model.predict(X_test)
-                cv_scores.append(r2_score(y_test, y_pred))
-            
-            # Final model training
-            X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-            model.fit(X_train, y_train)
-            
-            # Evaluate
-            y_pred = model.predict(X_test)
-            mae = mean_absolute_error(y_test, y_pred)
-            r2 = r2_score(y_test, y_pred)
-            
-            models[resort_name] = model
+        # Resorts have different patterns - the model picks them up by splitting on resort_code
+        resort_names = occupancy_df['resort_name'].astype('category').cat.remove_unused_categories()
+        X = occupancy_df[feature_columns].assign(resort_code=resort_names.cat.codes.to_numpy())
+        y = occupancy_df['occupancy_rate']
+        
+        # Time series split for validation
+        tscv = TimeSeriesSplit(n_splits=3)
+        
+        # Train model
+        # Needs more boosting rounds than a single-resort model to pick up each resort's pattern
+        model = HistGradientBoostingRegressor(max_iter=300, min_samples_leaf=10, learning_rate=0.1,
+                                              categorical_features=[len(feature_columns)], random_state=42)
+        
+        # Cross-validation - the folds are independent fits, so run them in parallel
+        cv_scores = cross_val_score(model, X, y, cv=tscv, scoring='r2', n_jobs=-1)
+        
+        # Final model training
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+        model.fit(X_train, y_train)
+        
+        # Evaluate per resort on the held-out split
+        y_pred = model.predict(X_test)
+        test_resorts = resort_names.loc[X_test.index]
+        train_counts = resort_names.loc[X_train.index].value_counts()
+        
+        model_performance = {}
+        for resort_name in resort_names.cat.categories:
+            in_resort = (test_resorts == resort_name).to_numpy()
             model_performance[resort_name] = {
-                'mae': round(mae, 4),
-                'r2_score': round(r2, 3),
-                'cv_mean': round(np.mean(cv_scores), 3),
-                'training_samples': len(X_train)
+                'mae': round(mean_absolute_error(y_test[in_resort], y_pred[in_resort]), 4),
+                'r2_score': round(r2_score(y_test[in_resort], y_pred[in_resort]), 3),
+                'training_samples': int(train_counts[resort_name])
             }
         
-        # Save models
-        self.models['occupancy_forecasting'] = models
-        for resort_name, model in models.items():
-            joblib.dump(model, self.models_path / f'occupancy_forecasting_{resort_name.replace(" ", "_")}.pkl')
+        # Save model
+        self.models['occupancy_forecasting'] = model
+        self.models['occupancy_forecasting_resorts'] = list(resort_names.cat.categories)
+        joblib.dump(model, self.models_path / 'occupancy_forecasting_model.pkl')
         
         avg_r2 = np.mean([perf['r2_score'] for perf in model_performance.values()])
-        logger.info(f"✅ Occupancy forecasting models built: Average R² = {avg_r2:.3f}")
+        logger.info(f"✅ Occupancy forecasting model built: Average R² = {avg_r2:.3f}")
         
         return {
-            'model_type': 'Gradient Boosting per Resort',
-            'models_trained': len(models),
+            'model_type': 'Hist Gradient Boosting across Resorts',
+            'models_trained': 1,
+            'overall_r2': round(r2_score(y_test, y_pred), 3),
+            'cv_mean': round(np.mean(cv_scores), 3),
             'average_r2': round(avg_r2, 3),
             'resort_performance': model_performance
         }
@@ -247,64 +259,74 @@ class RevenueOptimizationEngine:
         """Build dynamic pricing optimization model"""
         logger.info("💰 Building dynamic pricing optimization model...")
         
-        # Prepare pricing features
-        revenue_df['checkin_date'] = pd.to_datetime(revenue_df['checkin_date'])
-        
-        # Engineer pricing features
-        revenue_df['day_of_week'] = revenue_df['checkin_date'].dt.dayofweek
-        revenue_df['month'] = revenue_df['checkin_date'].dt.month
-        revenue_df['is_weekend'] = (revenue_df['day_of_week'] >= 5).astype(int)
-        revenue_df['is_holiday_month'] = revenue_df['month'].isin([6, 7, 8, 11, 12]).astype(int)
-        
-        # Add demand indicators
-        revenue_df['booking_lead_category'] = pd.cut(revenue_df['days_advance_booked'], 
-                                                   bins=[0, 14, 60, 180, 365], 
-                                                   labels=['Last_Minute', 'Normal', 'Early', 'Very_Early'])
+        # Add demand indicators - lead time bins (0,14], (14,60], (60,180], (180,365]; out of range is -1 (missing)
+        lead_days = revenue_df['days_advance_booked'].to_numpy()
+        booking_lead_code = np.searchsorted(np.array([14, 60, 180, 365]), lead_days, side='left').astype(np.int16)
+        booking_lead_code[(lead_days <= 0) | (lead_days > 365)] = -1
         
-        # Encode categorical variables
-        revenue_df = pd.get_dummies(revenue_df, columns=['resort_name', 'room_type', 'segment', 'booking_lead_category'], prefix_sep='_')
-        
-        # Select features for pricing
-        feature_columns = [col for col in revenue_df.columns if 
-                          col.startswith(('resort_name_', 'room_type_', 'segment_', 'booking_lead_category_')) or
-                          col in ['day_of_week', 'month', 'is_weekend', 'is_holiday_month', 
-                                'party_size', 'stay_length', 'seasonal_multiplier', 'annual_budget']]
-        
-        X = revenue_df[feature_columns].fillna(0)
+        # Encode categorical variables as integer codes - the trees split on them directly
+        categorical_features = {
+            'resort_name': revenue_df['resort_name'],
+            'room_type': revenue_df['room_type'],
+            'segment': revenue_df['segment']
+        }
+        category_levels = {}
+        features = {}
+        for col, values in categorical_features.items():
+            categories = values.astype('category')
+            category_levels[col] = list(categories.cat.categories)
+            features[f'{col}_code'] = categories.cat.codes.astype(np.int16)
+        category_levels['booking_lead_category'] = ['Last_Minute', 'Normal', 'Early', 'Very_Early']
+        features['booking_lead_category_code'] = booking_lead_code
+        
+        # Engineer pricing features into a separate frame - the caller's revenue_df is left untouched
+        day_of_week = revenue_df['checkin_date'].dt.dayofweek
+        month = revenue_df['checkin_date'].dt.month
+        features.update({
+            'day_of_week': day_of_week,
+            'month': month,
+            'is_weekend': (day_of_week >= 5).astype(int),
+            'is_holiday_month': month.isin([6, 7, 8, 11, 12]).astype(int),
+            'party_size': revenue_df['party_size'],
+            'stay_length': revenue_df['stay_length'],
+            'seasonal_multiplier': revenue_df['seasonal_multiplier'],
+            'annual_budget': revenue_df['annual_budget']
+        })
+        
+        X = pd.DataFrame(features).fillna(0)
+        feature_columns = list(X.columns)
         y = revenue_df['daily_rate']
         
         # Split data
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
         
-        # Scale features
-        scaler = StandardScaler()
-        X_train_scaled = scaler.fit_transform(X_train)
-        X_test_scaled = scaler.transform(X_test)
-        
-        # Train pricing model
-        pricing_model = GradientBoostingRegressor(n_estimators=150, learning_rate=0.1, random_state=42)
-        pricing_model.fit(X_train_scaled, y_train)
+        # Train pricing model - no scaling needed, tree splits don't care about feature scale
+        pricing_model = HistGradientBoostingRegressor(max_iter=150, max_depth=8, learning_rate=0.1,
+                                                      categorical_features=list(range(len(category_levels))),
+                                                      early_stopping=True, random_state=42)
+        pricing_model.fit(X_train, y_train)
         
         # Evaluate model
-        y_pred = pricing_model.predict(X_test_scaled)
+        y_pred = pricing_model.predict(X_test)
         mae = mean_absolute_error(y_test, y_pred)
         r2 = r2_score(y_test, y_pred)
         
-        # Feature importance
+        # Feature importance - hist gradient boosting has no impurity importances, so permute the test set
+        importance = permutation_importance(pricing_model, X_test, y_test, n_repeats=5, random_state=42)
         feature_importance = pd.DataFrame({
             'feature': feature_columns,
-            'importance': pricing_model.feature_importances_
+            'importance': importance.importances_mean
         }).sort_values('importance', ascending=False)
         
-        # Save model and scaler
+        # Save model and the category levels behind the integer codes
         self.models['dynamic_pricing'] = pricing_model
-        self.scalers['dynamic_pricing'] = scaler
+        self.models['dynamic_pricing_categories'] = category_levels
         
         joblib.dump(pricing_model, self.models_path / 'dynamic_pricing_model.pkl')
-        joblib.dump(scaler, self.models_path / 'dynamic_pricing_scaler.pkl')
+        joblib.dump(category_levels, self.models_path / 'dynamic_pricing_categories.pkl')
         
         model_metrics = {
-            'model_type': 'Gradient Boosting Regressor',
+            'model_type': 'Hist Gradient Boosting Regressor',
             'mae': round(mae, 2),
             'r2_score': round(r2, 3),
             'training_samples': len(X_train),
@@ -322,20 +344,25 @@ class RevenueOptimizationEngine:
         
         # Current performance baseline
         current_metrics = {
-            'total_revenue': revenue_df['total_revenue'].sum(),
-            'avg_daily_rate': revenue_df['daily_rate'].mean(),
-            'avg_total_spend': revenue_df['total_revenue'].mean(),
+            'total_revenue': float(revenue_df['total_revenue'].sum()),
+            'avg_daily_rate': float(revenue_df['daily_rate'].mean()),
+            'avg_total_spend': float(revenue_df['total_revenue'].mean()),
             'bookings_count': len(revenue_df)
         }
         
         # Revenue optimization by segment
-        segment_analysis = revenue_df.groupby('segment').agg({
-            'total_revenue': ['sum', 'mean', 'count'],
-            'daily_rate': 'mean',
-            'stay_length': 'mean',
-            'dining_revenue': 'mean',
-            'amenity_revenue': 'mean'
-        }).round(2)
+        segment_analysis = revenue_df.groupby('segment', observed=True).agg(
+            total_revenue_sum=('total_revenue', 'sum'),
+            total_revenue_mean=('total_revenue', 'mean'),
+            total_revenue_count=('total_revenue', 'count'),
+            daily_rate_mean=('daily_rate', 'mean'),
+            stay_length_mean=('stay_length', 'mean'),
+            dining_revenue_mean=('dining_revenue', 'mean'),
+            amenity_revenue_mean=('amenity_revenue', 'mean')
+        )
+        float32_columns = segment_analysis.select_dtypes(np.float32).columns
+        segment_analysis[float32_columns] = segment_analysis[float32_columns].astype(np.float64)
+        segment_analysis = segment_analysis.round(2)
         
         # Identify optimization opportunities
         opportunities = self._identify_revenue_opportunities(revenue_df)
@@ -345,7 +372,7 @@ class RevenueOptimizationEngine:
         
         optimization_results = {
             'current_performance': current_metrics,
-            'segment_analysis': segment_analysis.to_dict(),
+            'segment_analysis': segment_analysis.to_dict(orient='index'),
             'optimization_opportunities': opportunities,
             'revenue_scenarios': scenarios,
             'recommendations': self._generate_revenue_recommendations(revenue_df, opportunities)
@@ -358,49 +385,50 @@ class RevenueOptimizationEngine:
         """Identify specific revenue optimization opportunities"""
         opportunities = []
         
+        # Evaluate all opportunity masks in one pass over plain NumPy arrays
+        resort_median_rate = df.groupby('resort_name', observed=True)['daily_rate'].median().reindex(df['resort_name']).to_numpy()
+        daily_rate = df['daily_rate'].to_numpy()
+        total_revenue = df['total_revenue'].to_numpy()
+        ancillary_revenue = df['dining_revenue'].to_numpy() + df['amenity_revenue'].to_numpy()
+        
+        low_occupancy_high_price = (df['seasonal_multiplier'].to_numpy() < 1.0) & (daily_rate > resort_median_rate)
+        low_ancillary_spenders = ancillary_revenue < df['total_cost'].to_numpy() * 0.2
+        short_stays = df['stay_length'].to_numpy() < 3
+        non_loyalty_high_spenders = (df['loyalty_tier'].to_numpy() == 'None') & (total_revenue > np.quantile(total_revenue, 0.7))
+        
         # 1. Pricing optimization by demand
-        low_occupancy_high_price = df[
-            (df['seasonal_multiplier'] < 1.0) & (df['daily_rate'] > df.groupby('resort_name')['daily_rate'].transform('median'))
-        ]
-        if len(low_occupancy_high_price) > 0:
+        if low_occupancy_high_price.any():
             opportunities.append({
                 'type': 'pricing_optimization',
                 'description': 'Lower prices during low-demand periods to increase occupancy',
-                'potential_bookings': len(low_occupancy_high_price),
+                'potential_bookings': int(low_occupancy_high_price.sum()),
                 'estimated_impact': '8-12% occupancy increase'
             })
         
         # 2. Ancillary revenue opportunities
-        low_ancillary_spenders = df[
-            (df['dining_revenue'] + df['amenity_revenue']) < df['total_cost'] * 0.2
-        ]
-        if len(low_ancillary_spenders) > 0:
+        if low_ancillary_spenders.any():
             opportunities.append({
                 'type': 'ancillary_revenue',
                 'description': 'Increase dining and amenity spending through targeted offers',
-                'potential_guests': len(low_ancillary_spenders),
+                'potential_guests': int(low_ancillary_spenders.sum()),
                 'estimated_impact': '15-25% ancillary revenue increase'
             })
         
         # 3. Length of stay optimization
-        short_stays = df[df['stay_length'] < 3]
-        if len(short_stays) > 0:
+        if short_stays.any():
             opportunities.append({
                 'type': 'length_of_stay',
                 'description': 'Incentivize longer stays through package deals',
-                'potential_bookings': len(short_stays),
+                'potential_bookings': int(short_stays.sum()),
                 'estimated_impact': '20-30% revenue per guest increase'
             })
         
         # 4. Loyalty program optimization
-        non_loyalty_high_spenders = df[
-            (df['loyalty_tier'] == 'None') & (df['total_revenue'] > df['total_revenue'].quantile(0.7))
-        ]
-        if len(non_loyalty_high_spenders) > 0:
+        if non_loyalty_high_spenders.any():
             opportunities.append({
                 'type': 'loyalty_conversion',
                 'description': 'Convert high-spending guests to loyalty program',
-                'potential_members': len(non_loyalty_high_spenders),
+                'potential_members': int(non_loyalty_high_spenders.sum()),
                 'estimated_impact': '10-15% lifetime value increase'
             })
         
@@ -501,12 +529,12 @@ class RevenueOptimizationEngine:
                 'dynamic_pricing_performance': pricing_metrics,
                 'optimization_analysis': optimization_results,
                 'total_revenue_analyzed': optimization_results['current_performance']['total_revenue'],
-                'optimization_potential': sum([scenario['revenue_uplift'] 
-                                             for scenario in optimization_results['revenue_scenarios'].values()])
+                'optimization_potential': sum(scenario['revenue_uplift'] 
+                                              for scenario in optimization_results['revenue_scenarios'].values())
             }
             
-            with open(self.processed_path / 'revenue_optimization_summary.json', 'w') as f:
-                json.dump(revenue_summary, f, indent=2, default=str)
+            with open(self.processed_path / 'revenue_optimization_summary.json', 'wb') as f:
+                f.write(orjson.dumps(revenue_summary, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY, default=str))
             
             logger.info("✅ Revenue optimization results saved successfully")
             
@@ -529,7 +557,7 @@ def main():
         occupancy_metrics = engine.build_occupancy_forecasting_model(occupancy_df)
         
         # Build dynamic pricing model
-        pricing_metrics = engine.build_dynamic_pricing_model(revenue_df.copy())
+        pricing_metrics = engine.build_dynamic_pricing_model(revenue_df)
         
         # Calculate revenue optimization scenarios
         optimization_results = engine.calculate_revenue_optimization_scenarios(revenue_df)
@@ -539,7 +567,7 @@ def main():
         
         print("\n✅ Revenue Optimization Pipeline Complete!")
         print(f"💰 Analyzed ${optimization_results['current_performance']['total_revenue']:,.0f} in revenue")
-        print(f"🏨 Built occupancy models for {occupancy_metrics['models_trained']} resorts")
+        print(f"🏨 Built occupancy model across {len(occupancy_metrics['resort_performance'])} resorts")
         print(f"📊 Dynamic pricing model R²: {pricing_metrics['r2_score']:.3f}")
         print(f"🎯 Identified {len(optimization_results['optimization_opportunities'])} optimization opportunities")
         print(f"📈 Potential revenue uplift: ${optimization_results.get('optimization_potential', 0):,.0f}")
@@ -6,9 +6,10 @@ Visualizes wait times, crowd patterns, and provides optimization insights.
 import os
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
+from typing import Dict
 
 # Set page config
 st.set_page_config(
@@ -37,6 +38,134 @@ st.markdown("""
     </style>
     """, unsafe_allow_html=True)
 
+@st.cache_data(persist="disk")
+def load_processed_data(data_path: str, mtime: float) -> pd.DataFrame:
+    """
+    Read the processed data, cached on disk so reruns and restarts skip the read.
+    Args:
+        data_path: Path to the processed Parquet file
+        mtime: File modification time - a newer file gets a new cache entry
+    Returns:
+        pd.DataFrame: Processed theme park data
+    """
+    data = pd.read_parquet(data_path)
+    data['date'] = pd.to_datetime(data['date'])
+    return data
+
+# Aggregates and figure builders - cached per park and data file, so widget reruns reuse them instead of
+# re-filtering and regrouping. Frames are skipped from hashing (leading underscore).
+@st.cache_data
+def park_wait_summary(_data: pd.DataFrame, park: str, mtime: float) -> Dict:
+    """
+    Average wait times for a park, shared by the wait time charts and the recommendations.
+    Args:
+        _data: Processed theme park data (not hashed)
+        park: Park name
+        mtime: Data file modification time
+    Returns:
+        Dict: Average wait by attraction and by hour
+    """
+    # Only the columns needed - the filter then copies 3 columns instead of the whole frame
+    park_data = _data.loc[_data['park'] == park, ['attraction_name', 'hour', 'wait_time']]
+    return {
+        'by_attraction': park_data.groupby('attraction_name', observed=True)['wait_time'].mean(),
+        'by_hour': park_data.groupby('hour')['wait_time'].mean()
+    }
+
+@st.cache_data
+def wait_time_figures(_wait_summary: Dict, park: str, mtime: float):
+    """
+    Build the wait time by attraction and by hour charts for a park.
+    Args:
+        _wait_summary: Park averages from park_wait_summary (not hashed)
+        park: Park name
+        mtime: Data file modification time
+    Returns:
+        Tuple of the attraction bar chart and the hourly line chart
+    """
+    fig_wait = px.bar(
+        _wait_summary['by_attraction'].reset_index(),
+        x='attraction_name',
+        y='wait_time',
+        title='Average Wait Times by Attraction',
+        color='wait_time',
+        color_continuous_scale='Viridis'
+    )
+    fig_wait.update_layout(
+        xaxis_tickangle=-45,
+        showlegend=False
+    )
+    
+    fig_hour = px.line(
+        _wait_summary['by_hour'].reset_index(),
+        x='hour',
+        y='wait_time',
+        title='Average Wait Times by Hour',
+        line_shape='spline'
+    )
+    return fig_wait, fig_hour
+
+@st.cache_data
+def crowd_pattern_figures(_data: pd.DataFrame, park: str, mtime: float):
+    """
+    Build the day of week box plot and attraction availability charts for a park.
+    Args:
+        _data: Processed theme park data (not hashed)
+        park: Park name
+        mtime: Data file modification time
+    Returns:
+        Tuple of the crowd box plot and the availability bar chart
+    """
+    park_data = _data.loc[_data['park'] == park, ['attraction_name', 'day_of_week', 'wait_time', 'is_operating']]
+    fig_crowd = px.box(
+        park_data,
+        x='day_of_week',
+        y='wait_time',
+        title='Crowd Levels by Day of Week'
+    )
+    
+    operating_data = park_data.groupby('attraction_name', observed=True)['is_operating'].mean()
+    fig_status = px.bar(
+        operating_data,
+        title='Attraction Availability',
+        color=operating_data,
+        color_continuous_scale='RdYlGn'
+    )
+    return fig_crowd, fig_status
+
+@st.cache_data
+def weather_figure(_data: pd.DataFrame, park: str, mtime: float):
+    """
+    Build the wait time vs. temperature chart for a park.
+    Args:
+        _data: Processed theme park data (not hashed)
+        park: Park name
+        mtime: Data file modification time
+    Returns:
+        Scatter chart of average wait per whole degree with a lowess trendline
+    """
+    park_data = _data.loc[(_data['park'] == park) & _data['temp_c'].notna(), ['temp_c', 'wait_time']]
+    
+    # Average per whole degree - a couple dozen points to plot and fit instead of one per reading.
+    # Degrees are small non-negative ints once shifted, so bincount does the grouping without a groupby
+    temp_bin = np.round(park_data['temp_c'].to_numpy()).astype(np.intp)
+    lowest = temp_bin.min() if len(temp_bin) else 0
+    counts = np.bincount(temp_bin - lowest)
+    wait_sums = np.bincount(temp_bin - lowest, weights=park_data['wait_time'].to_numpy())
+    has_readings = counts > 0
+    wait_by_temp = pd.DataFrame({
+        'temp_c': np.flatnonzero(has_readings) + lowest,
+        'wait_time': wait_sums[has_readings] / counts[has_readings]
+    })
+    
+    return px.scatter(
+        wait_by_temp,
+        x='temp_c',
+        y='wait_time',
+        title='Average Wait Times vs. Temperature',
+        trendline="lowess"
+    )
+
 class ThemeParkDashboard:
     """Class to create and manage the theme park optimization dashboard."""
     
@@ -47,13 +176,14 @@ class ThemeParkDashboard:
     def load_data(self):
         """Load processed theme park data."""
         try:
-            data_path = os.path.join('..', 'data', 'processed', 'theme_park_data_processed.csv')
-            self.data = pd.read_csv(data_path)
-            self.data['date'] = pd.to_datetime(self.data['date'])
+            data_path = os.path.join('..', 'data', 'processed', 'theme_park_data_processed.parquet')
+            self.data_mtime = os.path.getmtime(data_path)
+            self.data = load_processed_data(data_path, self.data_mtime)
             self.parks = self.data['park'].unique()
         except Exception as e:
             st.error(f"Error loading data: {e}")
             self.data = pd.DataFrame()
+            self.data_mtime = None
             self.parks = []
     
     def create_header(self):
@@ -80,38 +210,19 @@ class ThemeParkDashboard:
         
         return selected_park, selected_date
     
-    def plot_wait_times(self, park: str, date: datetime):
+    def plot_wait_times(self, park: str, date: datetime, wait_summary: Dict):
         """Plot wait time distributions and patterns."""
         st.header("⏰ Wait Time Analysis")
         
         col1, col2 = st.columns(2)
+        fig_wait, fig_hour = wait_time_figures(wait_summary, park, self.data_mtime)
         
         with col1:
             # Average wait times by attraction
-            park_data = self.data[self.data['park'] == park]
-            fig_wait = px.bar(
-                park_data.groupby('attraction_name')['wait_time'].mean().reset_index(),
-                x='attraction_name',
-                y='wait_time',
-                title='Average Wait Times by Attraction',
-                color='wait_time',
-                color_continuous_scale='Viridis'
-            )
-            fig_wait.update_layout(
-                xaxis_tickangle=-45,
-                showlegend=False
-            )
             st.plotly_chart(fig_wait)
         
         with col2:
             # Wait times by hour
-            fig_hour = px.line(
-                park_data.groupby('hour')['wait_time'].mean().reset_index(),
-                x='hour',
-                y='wait_time',
-                title='Average Wait Times by Hour',
-                line_shape='spline'
-            )
             st.plotly_chart(fig_hour)
     
     def plot_crowd_patterns(self, park: str, date: datetime):
@@ -119,29 +230,17 @@ class ThemeParkDashboard:
         st.header("👥 Crowd Patterns")
         
         col1, col2 = st.columns(2)
+        fig_crowd, fig_status = crowd_pattern_figures(self.data, park, self.data_mtime)
         
         with col1:
             # Crowd levels by day of week
-            fig_crowd = px.box(
-                self.data[self.data['park'] == park],
-                x='day_of_week',
-                y='wait_time',
-                title='Crowd Levels by Day of Week'
-            )
             st.plotly_chart(fig_crowd)
         
         with col2:
             # Operating status
-            operating_data = self.data[self.data['park'] == park].groupby('attraction_name')['is_operating'].mean()
-            fig_status = px.bar(
-                operating_data,
-                title='Attraction Availability',
-                color=operating_data,
-                color_continuous_scale='RdYlGn'
-            )
             st.plotly_chart(fig_status)
     
-    def show_recommendations(self, park: str, date: datetime):
+    def show_recommendations(self, park: str, date: datetime, wait_summary: Dict):
         """Display AI-powered recommendations."""
         st.header("🎯 Smart Recommendations")
         
@@ -149,8 +248,7 @@ class ThemeParkDashboard:
         
         with col1:
             st.subheader("Optimal Visit Time")
-            park_data = self.data[self.data['park'] == park]
-            best_hour = park_data.groupby('hour')['wait_time'].mean().idxmin()
+            best_hour = wait_summary['by_hour'].idxmin()
             
             st.info(f"""
             🕒 Best time to visit: {best_hour}:00
@@ -161,7 +259,7 @@ class ThemeParkDashboard:
         
         with col2:
             st.subheader("Attraction Strategy")
-            busy_attractions = park_data.groupby('attraction_name')['wait_time'].mean().nlargest(3)
+            busy_attractions = wait_summary['by_attraction'].nlargest(3)
             
             st.warning("""
             🎯 Recommended Strategy:
@@ -177,14 +275,7 @@ class ThemeParkDashboard:
         st.header("🌦️ Weather Impact")
         
         if 'temp_c' in self.data.columns and 'wait_time' in self.data.columns:
-            fig = px.scatter(
-                self.data[self.data['park'] == park],
-                x='temp_c',
-                y='wait_time',
-                title='Wait Times vs. Temperature',
-                trendline="lowess"
-            )
-            st.plotly_chart(fig)
+            st.plotly_chart(weather_figure(self.data, park, self.data_mtime))
     
     def run_dashboard(self):
         """Run the complete dashboard."""
@@ -196,9 +287,12 @@ class ThemeParkDashboard:
         
         selected_park, selected_date = self.create_sidebar()
         
-        self.plot_wait_times(selected_park, selected_date)
+        # One filter + groupby per park, shared by the wait time charts and the recommendations
+        wait_summary = park_wait_summary(self.data, selected_park, self.data_mtime)
+        
+        self.plot_wait_times(selected_park, selected_date, wait_summary)
         self.plot_crowd_patterns(selected_park, selected_date)
-        self.show_recommendations(selected_park, selected_date)
+        self.show_recommendations(selected_park, selected_date, wait_summary)
         self.show_weather_impact(selected_park, selected_date)
         
         # Add footer
@@ -9,6 +9,7 @@ import requests
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from bs4 import BeautifulSoup
 import logging
@@ -24,6 +25,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Attraction list per park - built once at import rather than on every lookup.
+# This would typically come from an API or database
+PARK_ATTRACTIONS = {
+    'magic_kingdom': [
+        'Space Mountain',
+        'Big Thunder Mountain Railroad',
+        'Haunted Mansion',
+        'Pirates of the Caribbean',
+        'It\'s a Small World'
+    ],
+    'epcot': [
+        'Soarin\'',
+        'Test Track',
+        'Mission: SPACE',
+        'Spaceship Earth',
+        'Frozen Ever After'
+    ],
+    'hollywood_studios': [
+        'The Twilight Zone Tower of Terror',
+        'Star Tours',
+        'Slinky Dog Dash',
+        'Rise of the Resistance',
+        'Mickey & Minnie\'s Runaway Railway'
+    ],
+    'animal_kingdom': [
+        'Expedition Everest',
+        'Kilimanjaro Safaris',
+        'Avatar Flight of Passage',
+        'Dinosaur',
+        'Kali River Rapids'
+    ]
+}
+
 class ThemeParkDataCollector:
     """Class to collect theme park data from various sources."""
     
@@ -83,16 +117,15 @@ class ThemeParkDataCollector:
             attractions = self._get_park_attractions(park)
             current_time = datetime.now()
             
-            wait_times = []
-            for attraction in attractions:
-                wait_time = {
-                    'attraction_name': attraction,
-                    'wait_time': np.random.randint(5, 120),
-                    'timestamp': current_time,
-                    'park': park,
-                    'status': 'operating' if np.random.random() > 0.1 else 'closed'
-                }
-                wait_times.append(wait_time)
+            # One array per column for all attractions, instead of a dict per attraction
+            num_attractions = len(attractions)
+            wait_times = {
+                'attraction_name': attractions,
+                'wait_time': np.random.randint(5, 120, size=num_attractions),
+                'timestamp': current_time,
+                'park': park,
+                'status': np.where(np.random.random(num_attractions) > 0.1, 'operating', 'closed')
+            }
             
             return pd.DataFrame(wait_times)
             
@@ -108,69 +141,47 @@ class ThemeParkDataCollector:
         Returns:
             List[str]: List of attraction names
         """
-        # This would typically come from an API or database
-        attractions = {
-            'magic_kingdom': [
-                'Space Mountain',
-                'Big Thunder Mountain Railroad',
-                'Haunted Mansion',
-                'Pirates of the Caribbean',
-                'It\'s a Small World'
-            ],
-            'epcot': [
-                'Soarin\'',
-                'Test Track',
-                'Mission: SPACE',
-                'Spaceship Earth',
-                'Frozen Ever After'
-            ],
-            'hollywood_studios': [
-                'The Twilight Zone Tower of Terror',
-                'Star Tours',
-                'Slinky Dog Dash',
-                'Rise of the Resistance',
-                'Mickey & Minnie\'s Runaway Railway'
-            ],
-            'animal_kingdom': [
-                'Expedition Everest',
-                'Kilimanjaro Safaris',
-                'Avatar Flight of Passage',
-                'Dinosaur',
-                'Kali River Rapids'
-            ]
-        }
-        return attractions.get(park, [])
+        return PARK_ATTRACTIONS.get(park, [])
     
-    def collect_historical_data(self, start_date: str, end_date: str) -> None:
+    def collect_historical_data(self, start_date: str, end_date: str, max_workers: int = 8) -> None:
         """
         Collect historical data for all parks.
         Args:
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
+            max_workers: Number of park-days to collect concurrently
         """
         start = datetime.strptime(start_date, '%Y-%m-%d')
         end = datetime.strptime(end_date, '%Y-%m-%d')
-        current = start
+        dates = [(start + timedelta(days=offset)).strftime('%Y-%m-%d') for offset in range((end - start).days + 1)]
         
-        while current <= end:
-            date_str = current.strftime('%Y-%m-%d')
-            
-            for park in self.parks:
-                # Collect weather data
-                weather_data = self.fetch_weather_data(park, date_str)
-                if not weather_data.empty:
-                    self._save_data(weather_data, f'weather_{park}_{date_str}.csv')
-                
-                # Collect wait times (simulated historical data)
-                wait_times = self.fetch_wait_times(park)
-                if not wait_times.empty:
-                    self._save_data(wait_times, f'wait_times_{park}_{date_str}.csv')
-            
-            current += timedelta(days=1)
+        # Every park-day is independent and mostly spent waiting on the weather API, so run them side by side
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._collect_park_day, park, date_str)
+                       for date_str in dates for park in self.parks]
+            for future in futures:
+                future.result()
+    
+    def _collect_park_day(self, park: str, date_str: str) -> None:
+        """
+        Collect and save weather and wait times for one park on one day.
+        Args:
+            park: Park name
+            date_str: Date in YYYY-MM-DD format
+        """
+        # Collect weather data
+        weather_data = self.fetch_weather_data(park, date_str)
+        if not weather_data.empty:
+            self._save_data(weather_data, f'weather_{park}_{date_str}.parquet')
+        
+        # Collect wait times (simulated historical data)
+        wait_times = self.fetch_wait_times(park)
+        if not wait_times.empty:
+            self._save_data(wait_times, f'wait_times_{park}_{date_str}.parquet')
     
     def _save_data(self, data: pd.DataFrame, filename: str) -> None:
         """
-        Save collected data to CSV file.
+        Save collected data to a Parquet file.
         Args:
             data: DataFrame to save
             filename: Output filename
@@ -179,7 +190,7 @@ class ThemeParkDataCollector:
         os.makedirs(output_dir, exist_ok=True)
         
         output_path = os.path.join(output_dir, filename)
-        data.to_csv(output_path, index=False)
+        data.to_parquet(output_path, index=False)
         logger.info(f"Data saved to {output_path}")
 
 def main():
@@ -52,15 +52,15 @@ class ThemeParkDataProcessor:
             
             for park in self.parks:
                 # Load wait times
-                wait_times_file = os.path.join('data', 'raw', f'wait_times_{park}_{date_str}.csv')
+                wait_times_file = os.path.join('data', 'raw', f'wait_times_{park}_{date_str}.parquet')
                 if os.path.exists(wait_times_file):
-                    df = pd.read_csv(wait_times_file)
+                    df = pd.read_parquet(wait_times_file)
                     wait_times_dfs.append(df)
                 
                 # Load weather data
-                weather_file = os.path.join('data', 'raw', f'weather_{park}_{date_str}.csv')
+                weather_file = os.path.join('data', 'raw', f'weather_{park}_{date_str}.parquet')
                 if os.path.exists(weather_file):
-                    df = pd.read_csv(weather_file)
+                    df = pd.read_parquet(weather_file)
                     weather_dfs.append(df)
             
             current += timedelta(days=1)
@@ -95,6 +95,15 @@ class ThemeParkDataProcessor:
         # Create binary status column
         df['is_operating'] = (df['status'] == 'operating').astype(int)
         
+        # Small value ranges - downcast from the 64-bit defaults to cut memory for the merged dataset
+        df['wait_time'] = df['wait_time'].astype('float32')
+        df[['hour', 'day_of_week', 'is_weekend', 'is_operating']] = df[['hour', 'day_of_week', 'is_weekend', 'is_operating']].astype('int8')
+        
+        # Only a handful of parks, attractions and statuses - categorical is far smaller and groups faster.
+        # Done after the per-day files are concatenated, since concat falls back to object on mismatched categories
+        for col in ['park', 'attraction_name', 'status']:
+            df[col] = df[col].astype('category')
+        
         return df
     
     def clean_weather(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -125,6 +134,10 @@ class ThemeParkDataProcessor:
         # Handle missing values
         df = df.fillna(df.mean(numeric_only=True))
         
+        # Weather readings don't need float64 precision
+        numeric_features = [col for col in weather_features if col in df.columns]
+        df[numeric_features] = df[numeric_features].astype('float32')
+        
         return df
     
     def calculate_park_metrics(self, wait_times_df: pd.DataFrame) -> Dict:
@@ -143,7 +156,7 @@ class ThemeParkDataProcessor:
             'max_wait_time': wait_times_df['wait_time'].max(),
             'operating_percentage': wait_times_df['is_operating'].mean() * 100,
             'busiest_hour': wait_times_df.groupby('hour')['wait_time'].mean().idxmax(),
-            'busiest_attractions': wait_times_df.groupby('attraction_name')['wait_time'].mean().nlargest(5).to_dict()
+            'busiest_attractions': wait_times_df.groupby('attraction_name', observed=True)['wait_time'].mean().nlargest(5).to_dict()
         }
         
         return metrics
@@ -176,7 +189,7 @@ class ThemeParkDataProcessor:
     
     def save_processed_data(self, df: pd.DataFrame, filename: str) -> None:
         """
-        Save processed data to CSV file.
+        Save processed data to a Parquet file.
         Args:
             df: DataFrame to save
             filename: Output filename
@@ -185,7 +198,7 @@ class ThemeParkDataProcessor:
         os.makedirs(output_dir, exist_ok=True)
         
         output_path = os.path.join(output_dir, filename)
-        df.to_csv(output_path, index=False)
+        df.to_parquet(output_path, index=False)
         logger.info(f"Processed data saved to {output_path}")
 
 def main():
@@ -211,7 +224,7 @@ def main():
     logger.info(f"Park metrics: {metrics}")
     
     # Save processed data
-    processor.save_processed_data(merged_df, 'theme_park_data_processed.csv')
+    processor.save_processed_data(merged_df, 'theme_park_data_processed.parquet')
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file